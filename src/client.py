@@ -1,4 +1,7 @@
 import pynetbox
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 
 from src.constants import (
@@ -6,8 +9,16 @@ from src.constants import (
     MANAGED_TAG_NAME,
     MANAGED_TAG_COLOR,
     CACHE_RESOURCE_TYPES,
+    ENDPOINT_INTERFACES,
+    ENDPOINT_FRONT_PORTS,
+    ENDPOINT_REAR_PORTS,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BACKOFF_FACTOR,
 )
 from src.utils import (
+    filter_chunked,
     log_error,
     log_warning,
     log_info,
@@ -18,6 +29,33 @@ from src.utils import (
 
 console = Console()
 
+# Default for apply(existing=...): look the object up via the API
+_LOOKUP = object()
+
+
+def create_http_session() -> requests.Session:
+    """
+    Build the HTTP session shared by all pynetbox API instances.
+
+    Pooled keep-alive connections avoid a TCP+TLS handshake per API call and
+    are shared by the legacy syncers and the controller's worker threads.
+    Idempotent requests are retried with a short backoff.
+
+    Returns:
+        Configured requests session (certificate verification disabled)
+    """
+    session = requests.Session()
+    session.verify = False
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=HTTP_MAX_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF_FACTOR),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class NetBoxClient:
     """
     Modern NetBox client for device and cable reconciliation.
@@ -50,7 +88,8 @@ class NetBoxClient:
     - Legacy syncers inject via BaseSyncer._prepare_payload()
     """
 
-    def __init__(self, url: str, token: str, dry_run: bool = False):
+    def __init__(self, url: str, token: str, dry_run: bool = False,
+                 http_session: requests.Session | None = None):
         """
         Initialize NetBox client with eager caching strategy.
 
@@ -58,13 +97,17 @@ class NetBoxClient:
             url: NetBox instance URL
             token: API authentication token
             dry_run: Dry-run mode flag
+            http_session: Shared session (see create_http_session); a new one
+                is created if omitted
 
         Note:
             Call reload_global_cache() and reload_cache(site) before reconciliation
             to populate resource caches.
         """
-        self.nb = pynetbox.api(url, token=token)
-        self.nb.http_session.verify = False
+        # threading=True: after the first page, pynetbox fetches the remaining
+        # offset pages of a list request concurrently on the pooled session
+        self.nb = pynetbox.api(url, token=token, threading=True)
+        self.nb.http_session = http_session or create_http_session()
         self.dry_run = dry_run
 
         # Eager cache structure (pre-loaded before reconciliation)
@@ -80,6 +123,9 @@ class NetBoxClient:
             'manufacturers': {}   # Global: all manufacturers
         }
 
+        # Site-scoped VLAN lookup: site_id -> {vlan name: vlan id}
+        self.vlan_index = {}
+
         # Single source of truth for managed tag
         self.managed_tag_id = self._ensure_tag(MANAGED_TAG_SLUG)
 
@@ -197,6 +243,55 @@ class NetBoxClient:
         else:
             log_error(f"Site '{site_slug}' not found!")
 
+    def reload_site_caches(self, site_slugs):
+        """
+        Load site-specific data for several sites at once (EAGER LOADING).
+
+        Same result as calling reload_cache() per site, but VLANs and racks
+        of all sites are fetched together (one request per chunk of site
+        IDs). VLANs are additionally indexed per site (see get_vlan_id()).
+        Sites are resolved from the global cache, so call
+        reload_global_cache() first.
+
+        Args:
+            site_slugs: Site slugs or names to load caches for
+        """
+        site_ids = []
+        for site_slug in site_slugs:
+            site_id = self.get_id('sites', site_slug)
+            if not site_id:
+                # Not in the global cache (e.g. created meanwhile): ask NetBox
+                site_obj = self.nb.dcim.sites.get(slug=site_slug) or self.nb.dcim.sites.get(name=site_slug)
+                site_id = site_obj.id if site_obj else None
+            if site_id:
+                site_ids.append(site_id)
+            else:
+                log_error(f"Site '{site_slug}' not found!")
+
+        if not site_ids:
+            return
+
+        log_info(f"Reloading caches for {len(site_ids)} site(s)...")
+
+        try:
+            vlans = list(filter_chunked(self.nb.ipam.vlans, site_id=site_ids))
+            for vlan in vlans:
+                if vlan.site:
+                    self.vlan_index.setdefault(vlan.site.id, {})[vlan.name] = vlan.id
+            self._safe_load_queryset(vlans, 'vlans', use_name=True)
+        except Exception as e:
+            log_error("Error loading vlans", e)
+
+        self._safe_load_queryset(
+            filter_chunked(self.nb.dcim.racks, site_id=site_ids),
+            'racks',
+            use_name=True
+        )
+
+        # Warn if no racks found
+        if not self.cache['racks']:
+            log_warning(f"No racks found for Site IDs {site_ids}")
+
     def reload_global_cache(self):
         """
         Load global resources (EAGER LOADING) - not site-specific.
@@ -292,6 +387,24 @@ class NetBoxClient:
 
         return result
 
+    def get_vlan_id(self, site_id: int | None, name: str) -> int | None:
+        """
+        Get a VLAN ID by name, preferring the VLANs of the given site.
+
+        Args:
+            site_id: Site of the device the VLAN is used on
+            name: VLAN name
+
+        Returns:
+            Integer ID or None if not found
+        """
+        if not name:
+            return None
+        vlan_id = self.vlan_index.get(site_id, {}).get(name)
+        if vlan_id is None:
+            vlan_id = self.get_id('vlans', name)
+        return vlan_id
+
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
@@ -311,6 +424,77 @@ class NetBoxClient:
         api = getattr(self.nb.dcim, endpoint)
         return [dict(i) for i in api.filter(device_id=device_id)]
 
+    def get_devices_by_name(self, names) -> dict:
+        """
+        Bulk-fetch devices by name with one request per chunk of names.
+
+        Args:
+            names: Iterable of device names
+
+        Returns:
+            Dictionary mapping device name to pynetbox Record
+        """
+        names = sorted(set(names))
+        if not names:
+            return {}
+
+        devices = {}
+        for dev in filter_chunked(self.nb.dcim.devices, name=names):
+            if dev.name in devices:
+                console.print(
+                    f"[dim yellow]Warning: Multiple devices named '{dev.name}'. "
+                    f"Using first (ID {devices[dev.name].id}).[/dim yellow]"
+                )
+                continue
+            devices[dev.name] = dev
+        return devices
+
+    def get_port_index(self, device_ids,
+                       endpoints=(ENDPOINT_INTERFACES, ENDPOINT_FRONT_PORTS, ENDPOINT_REAR_PORTS)) -> dict:
+        """
+        Bulk-fetch the ports of several devices, one request per endpoint and chunk of IDs.
+
+        Args:
+            device_ids: Iterable of device IDs
+            endpoints: dcim port endpoints to fetch
+
+        Returns:
+            Dictionary endpoint -> {(device_id, port_name): pynetbox Record}
+        """
+        ids = sorted(set(device_ids))
+        index = {endpoint: {} for endpoint in endpoints}
+        if not ids:
+            return index
+
+        for endpoint in endpoints:
+            api = getattr(self.nb.dcim, endpoint)
+            index[endpoint] = {(p.device.id, p.name): p for p in filter_chunked(api, device_id=ids)}
+        return index
+
+    def get_cable_index(self, device_ids) -> dict:
+        """
+        Bulk-fetch all cables attached to several devices, one request per chunk of IDs.
+
+        Args:
+            device_ids: Iterable of device IDs
+
+        Returns:
+            Dictionary (object_type, object_id) -> cable (as dict), with an
+            entry for every termination of every cable
+        """
+        ids = sorted(set(device_ids))
+        index = {}
+        if not ids:
+            return index
+
+        # A cable between devices of different chunks is returned twice;
+        # both copies index the same terminations
+        for cable in filter_chunked(self.nb.dcim.cables, device_id=ids):
+            data = dict(cable)
+            for term in (data.get('a_terminations') or []) + (data.get('b_terminations') or []):
+                index[(term.get('object_type'), term.get('object_id'))] = data
+        return index
+
     def get_termination(self, device_name, port_name):
         devs = list(self.nb.dcim.devices.filter(name=device_name))
         if not devs: 
@@ -389,7 +573,7 @@ class NetBoxClient:
                 except Exception as e:
                     log_error(f"Failed to delete {endpoint} ID {obj_id}", e)
 
-    def apply(self, app: str, endpoint: str, lookup: dict, payload: dict):
+    def apply(self, app: str, endpoint: str, lookup: dict, payload: dict, existing=_LOOKUP):
         """
         Idempotent create-or-update with managed tag injection.
 
@@ -398,28 +582,19 @@ class NetBoxClient:
             endpoint: API endpoint
             lookup: Lookup criteria for existing object
             payload: Data to create/update
+            existing: Already prefetched existing object, or None if it is
+                known not to exist; skips the lookup request when given
 
         Returns:
             Created or updated object, or None on error
         """
         api_obj = getattr(getattr(self.nb, app), endpoint)
 
-        res = list(api_obj.filter(**lookup))
-        existing = res[0] if res else None
-
-        final_payload = payload.copy()
+        if existing is _LOOKUP:
+            res = list(api_obj.filter(**lookup))
+            existing = res[0] if res else None
 
-        # Clean tags and inject managed tag
-        if 'tags' in final_payload:
-            # Keep only integers (remove strings like 'gitops')
-            current_tags = [t for t in final_payload['tags'] if isinstance(t, int)]
-            if self.managed_tag_id and self.managed_tag_id not in current_tags:
-                current_tags.append(self.managed_tag_id)
-            final_payload['tags'] = current_tags
-        else:
-            # Fallback if no tags in payload
-            if self.managed_tag_id:
-                final_payload['tags'] = [self.managed_tag_id]
+        final_payload = self._with_managed_tag(payload)
 
         if not existing:
             # CREATE
@@ -444,4 +619,112 @@ class NetBoxClient:
                     log_error(f"Error updating {lookup}", e)
             else:
                 log_dry_run("Update", f"{endpoint}: {lookup}")
-            return existing
\ No newline at end of file
+            return existing
+
+    def apply_collection(self, app: str, endpoint: str, entries: list, existing_by_key: dict) -> dict:
+        """
+        Bulk create-or-update of several objects with managed tag injection.
+
+        Same semantics as apply() per entry, but existence is decided from
+        already prefetched objects and all creates / all changed objects are
+        sent as one bulk POST / PATCH. A failed bulk create falls back to
+        creating the entries one by one.
+
+        Args:
+            app: NetBox app (e.g., 'dcim', 'ipam')
+            endpoint: API endpoint
+            entries: List of (key, lookup, payload) tuples; lookup is only
+                used for logging
+            existing_by_key: Prefetched existing objects by key
+
+        Returns:
+            Dictionary key -> created or existing object (entries that
+            failed to be created are missing)
+        """
+        api_obj = getattr(getattr(self.nb, app), endpoint)
+        results = {}
+        creates = []
+        updates = []
+        # (existing Record, changes, lookup) of each queued update
+        pending = []
+
+        for key, lookup, payload in entries:
+            final_payload = self._with_managed_tag(payload)
+            existing = existing_by_key.get(key)
+
+            if not existing:
+                if self.dry_run:
+                    log_dry_run("Create", f"{endpoint}: {lookup}")
+                    results[key] = type('MockObject', (), {'id': 0, 'name': lookup.get('name')})()
+                else:
+                    creates.append((key, lookup, final_payload))
+                continue
+
+            results[key] = existing
+            if self.dry_run:
+                log_dry_run("Update", f"{endpoint}: {lookup}")
+                continue
+
+            # Let pynetbox compute the field diff on a detached copy: the live
+            # Record must not show values NetBox has not accepted yet
+            scratch = type(existing)(dict(existing), existing.api, existing.endpoint)
+            for field, value in final_payload.items():
+                setattr(scratch, field, value)
+            changes = scratch.updates()
+            if changes:
+                updates.append({'id': existing.id, **changes})
+                pending.append((existing, changes, lookup))
+
+        # Success is only logged once the bulk request has returned
+        if updates:
+            try:
+                api_obj.update(updates)
+                for existing, changes, lookup in pending:
+                    for field, value in changes.items():
+                        setattr(existing, field, value)
+                    log_info(f"Updated {endpoint}: {lookup}")
+            except Exception as e:
+                log_error(f"Error updating {len(updates)} {endpoint}", e)
+
+        if creates:
+            try:
+                created = api_obj.create([final_payload for _, _, final_payload in creates])
+                for (key, lookup, _), obj in zip(creates, created):
+                    results[key] = obj
+                    log_success(f"Create {endpoint}: {lookup}")
+            except Exception as e:
+                log_warning(f"Bulk create of {len(creates)} {endpoint} failed ({e}), retrying individually")
+                for key, lookup, final_payload in creates:
+                    try:
+                        results[key] = api_obj.create(**final_payload)
+                        log_success(f"Create {endpoint}: {lookup}")
+                    except Exception as e:
+                        log_error(f"Error creating {lookup}", e)
+
+        return results
+
+    def _with_managed_tag(self, payload: dict) -> dict:
+        """
+        Copy a payload, keeping only tag IDs and injecting the managed tag.
+
+        Args:
+            payload: Data to create/update
+
+        Returns:
+            Payload copy with cleaned tags
+        """
+        final_payload = payload.copy()
+
+        # Clean tags and inject managed tag
+        if 'tags' in final_payload:
+            # Keep only integers (remove strings like 'gitops')
+            current_tags = [t for t in final_payload['tags'] if isinstance(t, int)]
+            if self.managed_tag_id and self.managed_tag_id not in current_tags:
+                current_tags.append(self.managed_tag_id)
+            final_payload['tags'] = current_tags
+        else:
+            # Fallback if no tags in payload
+            if self.managed_tag_id:
+                final_payload['tags'] = [self.managed_tag_id]
+
+        return final_payload
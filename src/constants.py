@@ -59,6 +59,9 @@ DEFAULT_CABLE_TYPE: Final[str] = "cat6a"
 DEFAULT_CABLE_STATUS: Final[str] = "connected"
 DEFAULT_LENGTH_UNIT: Final[str] = "m"
 
+# Cables per bulk POST (keeps request bodies well below proxy/server limits)
+CABLE_BULK_CHUNK_SIZE: Final[int] = 100
+
 # Cable color mapping (name -> hex)
 CABLE_COLOR_MAP: Final[dict] = {
     'purple': '800080',
@@ -100,6 +103,33 @@ CACHE_RESOURCE_TYPES: Final[frozenset] = frozenset([
     'manufacturers',
 ])
 
+# HTTP connection pooling (keep-alive) for the pynetbox requests session
+HTTP_POOL_CONNECTIONS: Final[int] = 64
+HTTP_POOL_MAXSIZE: Final[int] = 64
+HTTP_MAX_RETRIES: Final[int] = 3
+HTTP_RETRY_BACKOFF_FACTOR: Final[float] = 0.1
+
+# Concurrent endpoint fetches when pre-warming legacy syncer caches
+PREWARM_MAX_WORKERS: Final[int] = 8
+
+# Concurrent DELETE requests when cleaning up stale child objects
+DELETE_MAX_WORKERS: Final[int] = 8
+
+# Concurrent requests for independent components (interfaces, template sets)
+COMPONENT_SYNC_MAX_WORKERS: Final[int] = 16
+
+# Concurrent ensure_object() calls for independent legacy objects (roles, module types)
+ENSURE_MAX_WORKERS: Final[int] = 16
+
+# Values per multi-valued filter in one prefetch GET (keeps the query string
+# below proxy/server URI length limits)
+PREFETCH_FILTER_CHUNK_SIZE: Final[int] = 100
+
+# Persistent lookup cache (opt-in): slug/name -> ID maps reused across runs
+# while an endpoint's object count and newest last_updated timestamp are
+# unchanged. Enabled by setting this environment variable to a directory.
+DISK_CACHE_DIR_ENV: Final[str] = "NETBOX_GITOPS_CACHE_DIR"
+
 # ============================================================================
 # DEFAULT VALUES
 # ============================================================================
@@ -1,3 +1,6 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Literal, List, Union, Set, Tuple, Dict
 from src.models import DeviceConfig, InterfaceConfig
 from src.client import NetBoxClient
@@ -13,6 +16,8 @@ from src.constants import (
     DEFAULT_CABLE_TYPE,
     DEFAULT_CABLE_STATUS,
     DEFAULT_LENGTH_UNIT,
+    CABLE_BULK_CHUNK_SIZE,
+    COMPONENT_SYNC_MAX_WORKERS,
     WAIT_AFTER_CABLE_DELETE,
     WAIT_AFTER_MODULE_DELETE,
     LOG_PREFIX_CABLE,
@@ -27,6 +32,8 @@ from src.utils import (
     cable_connects_to,
     safe_sleep,
     extract_device_role_slug,
+    dump_payload,
+    LogBuffer,
     log_error,
     log_warning,
     log_success,
@@ -41,6 +48,35 @@ console = Console()
 # Type alias for termination types
 TerminationType = Literal['dcim.interface', 'dcim.frontport', 'dcim.rearport']
 
+# Interned cable payload keys (built once, reused for every cable in the loop)
+(_K_A, _K_B, _K_OT, _K_OID, _K_TYPE, _K_STATUS, _K_TAGS,
+ _K_COLOR, _K_LENGTH, _K_LENGTH_UNIT) = map(sys.intern, (
+    "a_terminations", "b_terminations", "object_type", "object_id", "type",
+    "status", "tags", "color", "length", "length_unit",
+))
+
+# Local port endpoint -> cable termination type
+_ENDPOINT_TERMINATION_TYPES: Dict[str, str] = {
+    ENDPOINT_INTERFACES: TERMINATION_INTERFACE,
+    ENDPOINT_FRONT_PORTS: TERMINATION_FRONT_PORT,
+    ENDPOINT_REAR_PORTS: TERMINATION_REAR_PORT,
+}
+
+def _forget_cable(cable_by_term: Dict[tuple, dict], cable: dict):
+    """Drop a deleted cable from a termination -> cable map."""
+    for term in (cable.get(_K_A) or []) + (cable.get(_K_B) or []):
+        cable_by_term.pop((term.get(_K_OT), term.get(_K_OID)), None)
+
+
+# Payload exclusions, built once instead of per model_dump() call
+_DEVICE_EXCLUDE = frozenset({'interfaces', 'site_slug', 'role_slug', 'device_type_slug', 'rack_slug',
+                             'front_ports', 'rear_ports', 'modules', 'parent_device', 'device_bay'})
+_REAR_PORT_EXCLUDE = frozenset({'link'})
+_FRONT_PORT_EXCLUDE = frozenset({'link', 'rear_port'})
+_INTERFACE_EXCLUDE = frozenset({'ip', 'untagged_vlan', 'tagged_vlans', 'link', 'address_role'})
+_IP_EXCLUDE = frozenset({'vrf'})
+
+
 class DeviceController:
     def __init__(self, client: NetBoxClient):
         self.client = client
@@ -178,10 +214,7 @@ class DeviceController:
         # We ALWAYS create it FIRST in the rack (or inherited rack) to make it valid.
         final_rack_id = yaml_rack_id if yaml_rack_id else parent_rack_id
         
-        exclude_fields = {'interfaces', 'site_slug', 'role_slug', 'device_type_slug', 'rack_slug', 
-                          'front_ports', 'rear_ports', 'modules', 'parent_device', 'device_bay'}
-        
-        device_payload = desired_device.model_dump(exclude=exclude_fields, exclude_none=True)
+        device_payload = dump_payload(desired_device, _DEVICE_EXCLUDE)
         device_payload.update({'site': site_id, 'role': role_id, 'device_type': type_id})
 
         if final_rack_id:
@@ -262,7 +295,8 @@ class DeviceController:
         # E. Komponenten
         if nb_device:
             self._reconcile_device_bays(nb_device)
-            nb_device_data = {'id': nb_device.id, 'name': nb_device.name, 'role_slug': desired_device.role_slug}
+            nb_device_data = {'id': nb_device.id, 'name': nb_device.name, 'role_slug': desired_device.role_slug,
+                              'site_id': site_id}
             self._reconcile_rear_ports(nb_device_data, getattr(desired_device, 'rear_ports', []))
             self._reconcile_front_ports(nb_device_data, getattr(desired_device, 'front_ports', []))
             self._reconcile_interfaces(nb_device_data, desired_device.interfaces)
@@ -275,7 +309,7 @@ class DeviceController:
     def _reconcile_rear_ports(self, nb_device_data: dict, rear_ports: list):
         if not rear_ports: return
         for port_cfg in rear_ports:
-            payload = port_cfg.model_dump(exclude={'link'}, exclude_none=True)
+            payload = dump_payload(port_cfg, _REAR_PORT_EXCLUDE)
             payload['device'] = nb_device_data['id']
             if hasattr(port_cfg, 'positions'): 
                 payload['positions'] = port_cfg.positions
@@ -284,7 +318,7 @@ class DeviceController:
     def _reconcile_front_ports(self, nb_device_data: dict, front_ports: list):
         if not front_ports: return
         for port_cfg in front_ports:
-            payload = port_cfg.model_dump(exclude={'link', 'rear_port'}, exclude_none=True)
+            payload = dump_payload(port_cfg, _FRONT_PORT_EXCLUDE)
             payload['device'] = nb_device_data['id']
             if port_cfg.rear_port:
                 rp = self.client.nb.dcim.rear_ports.get(device_id=nb_device_data['id'], name=port_cfg.rear_port)
@@ -296,32 +330,69 @@ class DeviceController:
     # INTERFACES & IPs
     # --------------------------------------------------------------------------
     def _reconcile_interfaces(self, nb_device_data: dict, interfaces: list):
-        for iface_config in interfaces:
-            payload = iface_config.model_dump(exclude={'ip', 'untagged_vlan', 'tagged_vlans', 'link', 'address_role'}, exclude_none=True)
-            payload['device'] = nb_device_data['id']
-            
-            untagged = self.client.get_id('vlans', iface_config.untagged_vlan)
-            if untagged: 
-                payload['untagged_vlan'] = untagged
-            
-            tagged = [self.client.get_id('vlans', v) for v in iface_config.tagged_vlans]
-            if tagged: 
-                payload['tagged_vlans'] = [x for x in tagged if x]
+        if not interfaces:
+            return
 
-            nb_iface = self.client.apply('dcim', 'interfaces', {'device_id': nb_device_data['id'], 'name': iface_config.name}, payload)
-            
-            if nb_iface and iface_config.ip:
-                self._reconcile_ip(dict(nb_iface), iface_config)
+        # Prefetch the device's interfaces and IPs once instead of one lookup
+        # request per interface and per IP
+        device_id = nb_device_data['id']
+        iface_by_name = {i.name: i for i in self.client.nb.dcim.interfaces.filter(device_id=device_id)}
+        ip_by_addr = {
+            (ip.address, ip.vrf.id if ip.vrf else None): ip
+            for ip in self.client.nb.ipam.ip_addresses.filter(device_id=device_id)
+        }
 
-    def _reconcile_ip(self, nb_iface: dict, iface_config: InterfaceConfig):
+        # One bulk POST for new and one bulk PATCH for changed interfaces
+        entries = [
+            (iface_config.name,
+             {'device_id': device_id, 'name': iface_config.name},
+             self._interface_payload(nb_device_data, iface_config))
+            for iface_config in interfaces
+        ]
+        nb_ifaces = self.client.apply_collection('dcim', 'interfaces', entries, iface_by_name)
+
+        # IPs are independent of each other: overlap their round-trips
+        with_ip = [
+            iface_config for iface_config in interfaces
+            if iface_config.ip and nb_ifaces.get(iface_config.name)
+        ]
+        if with_ip:
+            reconcile_ip = partial(self._reconcile_ip, ip_by_addr=ip_by_addr)
+            with ThreadPoolExecutor(max_workers=COMPONENT_SYNC_MAX_WORKERS) as executor:
+                list(executor.map(
+                    reconcile_ip, [dict(nb_ifaces[i.name]) for i in with_ip], with_ip
+                ))
+
+    def _interface_payload(self, nb_device_data: dict, iface_config: InterfaceConfig) -> dict:
+        payload = dump_payload(iface_config, _INTERFACE_EXCLUDE)
+        payload['device'] = nb_device_data['id']
+
+        site_id = nb_device_data.get('site_id')
+        untagged = self.client.get_vlan_id(site_id, iface_config.untagged_vlan)
+        if untagged: 
+            payload['untagged_vlan'] = untagged
+
+        tagged = [self.client.get_vlan_id(site_id, v) for v in iface_config.tagged_vlans]
+        if tagged: 
+            payload['tagged_vlans'] = [x for x in tagged if x]
+
+        return payload
+
+    def _reconcile_ip(self, nb_iface: dict, iface_config: InterfaceConfig, ip_by_addr: Optional[dict] = None):
         ip_config = iface_config.ip
         vrf_id = self.client.get_id('vrfs', ip_config.vrf)
-        ip_payload = ip_config.model_dump(exclude={'vrf'}, exclude_none=True)
+        ip_payload = dump_payload(ip_config, _IP_EXCLUDE)
         if vrf_id: 
             ip_payload['vrf'] = vrf_id
         ip_payload.update({'assigned_object_type': 'dcim.interface', 'assigned_object_id': nb_iface['id']})
-        
-        nb_ip = self.client.apply('ipam', 'ip_addresses', {'address': ip_config.address, 'vrf_id': vrf_id} if vrf_id else {'address': ip_config.address}, ip_payload)
+
+        lookup = {'address': ip_config.address, 'vrf_id': vrf_id} if vrf_id else {'address': ip_config.address}
+        existing_ip = (ip_by_addr or {}).get((ip_config.address, vrf_id or None))
+        if existing_ip is not None:
+            nb_ip = self.client.apply('ipam', 'ip_addresses', lookup, ip_payload, existing=existing_ip)
+        else:
+            # Not on this device yet: may still exist elsewhere, so look it up
+            nb_ip = self.client.apply('ipam', 'ip_addresses', lookup, ip_payload)
         
         if nb_ip and iface_config.address_role == 'primary':
              self.client.update_device_primary_ip(nb_iface['device'], nb_ip.id)
@@ -447,7 +518,9 @@ class DeviceController:
         device_name = config.name
         device_role = nb_device_data.get("role_slug")
 
-        console.print(f"[bold cyan][CABLE][/bold cyan] Reconciling cables for {device_name} (ID {device_id})")
+        # Per-link progress lines are buffered and printed once per phase
+        log = LogBuffer()
+        log(f"[bold cyan][CABLE][/bold cyan] Reconciling cables for {device_name} (ID {device_id})")
 
         # ------------------------------------------------------------------
         # 1. Lokale Ports sammeln
@@ -460,7 +533,7 @@ class DeviceController:
                 p["_endpoint"] = endpoint
                 local_ports_dict[p["name"]] = p
 
-        console.print(f"[CABLE:1] Local ports: {list(local_ports_dict.keys())}")
+        log(f"[CABLE:1] Local ports: {list(local_ports_dict.keys())}")
 
         # ------------------------------------------------------------------
         # 2. Alle konfigurierten Ports mit Link sammeln
@@ -471,7 +544,21 @@ class DeviceController:
         config_ports.extend(getattr(config, "rear_ports", []))
 
         linked_ports = [p for p in config_ports if getattr(p, "link", None)]
-        console.print(f"[CABLE:1] Ports with links: {[p.name for p in linked_ports]}")
+        log(f"[CABLE:1] Ports with links: {[p.name for p in linked_ports]}")
+
+        # Prefetch all peer devices and their ports up front: one request per
+        # endpoint instead of a device GET and a port GET per link
+        peer_devices = self.client.get_devices_by_name(p.link.peer_device for p in linked_ports)
+        port_index = self.client.get_port_index(d.id for d in peer_devices.values())
+
+        # Cables on this device and its peers, keyed by (object_type, object_id)
+        # of each termination: replaces a cable GET and a fresh port GET per link
+        cable_by_term = self.client.get_cable_index(
+            [device_id, *(d.id for d in peer_devices.values())]
+        )
+
+        # (payload, label) of cables to create, sent in bulk after the loop
+        pending_cables: List[Tuple[dict, str]] = []
 
         # ------------------------------------------------------------------
         # 3. Verarbeitung je Link
@@ -481,17 +568,17 @@ class DeviceController:
             local = local_ports_dict.get(port_cfg.name)
 
             if not local:
-                console.print(f"[yellow][CABLE] Local port {port_cfg.name} not found – skipping[/yellow]")
+                log(f"[yellow][CABLE] Local port {port_cfg.name} not found – skipping[/yellow]")
                 continue
 
-            console.print(f"\n[bold][CABLE:2][/bold] {device_name}:{port_cfg.name}")
+            log(f"\n[bold][CABLE:2][/bold] {device_name}:{port_cfg.name}")
 
             # --------------------------------------------------------------
             # A. Peer-Gerät auflösen und Rolle GARANTIEREN
             # --------------------------------------------------------------
-            peer_device = self.client.nb.dcim.devices.get(name=link.peer_device)
+            peer_device = peer_devices.get(link.peer_device)
             if not peer_device:
-                console.print(f"[red]Peer device {link.peer_device} not found[/red]")
+                log(f"[red]Peer device {link.peer_device} not found[/red]")
                 continue
 
             peer_role = None
@@ -515,70 +602,50 @@ class DeviceController:
                             if role_obj:
                                 peer_role = getattr(role_obj, 'slug', None)
                 except Exception as e:
-                    console.print(f"[red]CRITICAL ROLE RE-FETCH FAILED for {link.peer_device}: {e}[/red]")
+                    log(f"[red]CRITICAL ROLE RE-FETCH FAILED for {link.peer_device}: {e}[/red]")
             
             if not peer_role:
-                console.print(f"[red bold]FAILED: Peer device {link.peer_device} role could not be resolved. Skipping.[/red bold]")
+                log(f"[red bold]FAILED: Peer device {link.peer_device} role could not be resolved. Skipping.[/red bold]")
                 continue
 
             is_src_pp = device_role == "patch-panel"
             is_dst_pp = peer_role == "patch-panel"
 
-            console.print(f"[CABLE:2] Peer = {peer_device.name} (role={peer_role})")
+            log(f"[CABLE:2] Peer = {peer_device.name} (role={peer_role})")
 
             # --------------------------------------------------------------
             # B. Peer-Port EXPLIZIT bestimmen
             # --------------------------------------------------------------
-            peer = None
-            term_b_type = None
-
-            try:
-                if is_src_pp and is_dst_pp:
-                    # Patchpanel ↔ Patchpanel = Rear ↔ Rear (Backbone)
-                    peer = self.client.nb.dcim.rear_ports.get(
-                        device_id=peer_device.id,
-                        name=link.peer_port,
-                    )
-                    term_b_type = "dcim.rearport"
-
-                elif is_dst_pp:
-                    # Device → Patchpanel = FrontPort (Server/Switch Access)
-                    peer = self.client.nb.dcim.front_ports.get(
-                        device_id=peer_device.id,
-                        name=link.peer_port,
-                    )
-                    term_b_type = "dcim.frontport"
+            if is_src_pp and is_dst_pp:
+                # Patchpanel ↔ Patchpanel = Rear ↔ Rear (Backbone)
+                peer_endpoint = ENDPOINT_REAR_PORTS
+            elif is_dst_pp:
+                # Device → Patchpanel = FrontPort (Server/Switch Access)
+                peer_endpoint = ENDPOINT_FRONT_PORTS
+            else:
+                # Device → Device (Interface)
+                peer_endpoint = ENDPOINT_INTERFACES
 
-                else:
-                    # Device → Device (Interface)
-                    peer = self.client.nb.dcim.interfaces.get(
-                        device_id=peer_device.id,
-                        name=link.peer_port,
-                    )
-                    term_b_type = "dcim.interface"
-
-            except Exception as e:
-                console.print(f"[red]Peer resolution error: {e}[/red]")
-                continue
+            # Single dict lookup on the prefetched index, strictly on the
+            # role-derived port type: a same-named port of another type is
+            # never used in its place
+            peer = port_index[peer_endpoint].get((peer_device.id, link.peer_port))
+            term_b_type = _ENDPOINT_TERMINATION_TYPES[peer_endpoint]
 
             if not peer:
-                console.print(f"[red]Peer port {link.peer_device}:{link.peer_port} not found[/red]")
+                log(f"[red]Peer port {link.peer_device}:{link.peer_port} not found[/red]")
                 continue
  # --------------------------------------------------------------
             # C. Termination-Typen festlegen
             # --------------------------------------------------------------
-            term_a_type = {
-                "interfaces": "dcim.interface",
-                "front_ports": "dcim.frontport",
-                "rear_ports": "dcim.rearport",
-            }[local["_endpoint"]]
+            term_a_type = _ENDPOINT_TERMINATION_TYPES[local["_endpoint"]]
             
             peer_obj_id = getattr(peer, 'id', None)
             if not peer_obj_id:
-                console.print(f"[red]Peer object {link.peer_device}:{link.peer_port} has no ID - skipping.[/red]")
+                log(f"[red]Peer object {link.peer_device}:{link.peer_port} has no ID - skipping.[/red]")
                 continue
 
-            console.print(
+            log(
                 f"[CABLE:2] Terminations: "
                 f"{term_a_type}:{local['id']} → {term_b_type}:{peer_obj_id}"
             )
@@ -586,106 +653,107 @@ class DeviceController:
             # --------------------------------------------------------------
             # D. Check existing cable at local port
             # --------------------------------------------------------------
-            existing = local.get("cable")
+            existing = cable_by_term.get((term_a_type, local["id"]))
             if existing:
-                try:
-                    existing = self.client.nb.dcim.cables.get(existing["id"])
-                    if existing: 
-                        existing = dict(existing)
-                except Exception:
-                    existing = None
-                
-                if not existing:
-                    console.print("[CABLE:3] Existing cable vanished during fetch – skipping idempotency check")
-                elif self._cable_connects_to(existing, peer.id):
-                    console.print("[CABLE:3] Correct cable already exists – skipping")
+                if cable_connects_to(existing, peer_obj_id):
+                    log("[CABLE:3] Correct cable already exists – skipping")
                     continue
                 else:
-                    console.print("[CABLE:3] Wrong cable on local port – deleting")
-                    self._safe_delete(existing, "wrong peer connection", force=True)
+                    log("[CABLE:3] Wrong cable on local port – deleting")
+                    log.flush()
+                    if self._safe_delete(existing, "wrong peer connection", force=True):
+                        _forget_cable(cable_by_term, existing)
 
             # --------------------------------------------------------------
             # E. Peer-Port prüfen (Stray cables)
             # --------------------------------------------------------------
-            fresh_peer = None
-            try:
-                if term_b_type == "dcim.frontport":
-                    fresh_peer = self.client.nb.dcim.front_ports.get(peer_obj_id)
-                elif term_b_type == "dcim.rearport":
-                    fresh_peer = self.client.nb.dcim.rear_ports.get(peer_obj_id)
+            peer_cable = cable_by_term.get((term_b_type, peer_obj_id))
+            if peer_cable:
+                if term_b_type == TERMINATION_REAR_PORT and is_dst_pp:
+                    if not cable_connects_to(peer_cable, local["id"]):
+                        log("[CABLE:3] Wrong backbone cable – deleting")
+                        log.flush()
+                        if self._safe_delete(peer_cable, "wrong backbone", force=True):
+                            _forget_cable(cable_by_term, peer_cable)
+                    else:
+                        log("[CABLE:3] Backbone cable correct – keeping")
+                        continue 
                 else:
-                    fresh_peer = self.client.nb.dcim.interfaces.get(peer_obj_id)
-            except Exception as e:
-                console.print(f"[yellow]Warning fetching fresh peer: {e}[/yellow]")
-
-            if fresh_peer and hasattr(fresh_peer, 'cable') and fresh_peer.cable:
-                try:
-                    peer_cable = self.client.nb.dcim.cables.get(fresh_peer.cable.id)
-                    if peer_cable: 
-                        peer_cable = dict(peer_cable)
-                    
-                    if peer_cable:
-                        if term_b_type == "dcim.rearport" and is_dst_pp:
-                            if not self._cable_connects_to(peer_cable, local["id"]):
-                                console.print("[CABLE:3] Wrong backbone cable – deleting")
-                                self._safe_delete(peer_cable, "wrong backbone", force=True)
-                            else:
-                                console.print("[CABLE:3] Backbone cable correct – keeping")
-                                continue 
-                        else:
-                            console.print("[CABLE:3] Peer port blocked – deleting")
-                            self._safe_delete(peer_cable, "blocking target port", force=True)
-                except Exception as e:
-                    console.print(f"[yellow]Warning processing peer cable: {e}[/yellow]")
+                    log("[CABLE:3] Peer port blocked – deleting")
+                    log.flush()
+                    if self._safe_delete(peer_cable, "blocking target port", force=True):
+                        _forget_cable(cable_by_term, peer_cable)
 
             # --------------------------------------------------------------
-            # F. Create cable (FIXED)
+            # F. Build cable payload (created in bulk after the loop)
             # --------------------------------------------------------------
             cable_data = {
-                "a_terminations": [
-                    {"object_type": term_a_type, "object_id": local["id"]}
+                _K_A: [
+                    {_K_OT: term_a_type, _K_OID: local["id"]}
                 ],
-                "b_terminations": [
-                    {"object_type": term_b_type, "object_id": peer_obj_id}
+                _K_B: [
+                    {_K_OT: term_b_type, _K_OID: peer_obj_id}
                 ],
-                "status": "connected",
-                "type": link.cable_type or "cat6a",
-                "tags": [self.client.managed_tag_id],
+                _K_STATUS: DEFAULT_CABLE_STATUS,
+                _K_TYPE: link.cable_type or DEFAULT_CABLE_TYPE,
+                _K_TAGS: [self.client.managed_tag_id],
             }
             
             # Add color only if present
-            color = self._normalize_color(link.color)
+            color = normalize_color(link.color)
             if color:
-                cable_data['color'] = color
+                cable_data[_K_COLOR] = color
             
             # Add length if present
             if link.length:
-                cable_data['length'] = link.length
-                cable_data['length_unit'] = link.length_unit or 'm'
+                cable_data[_K_LENGTH] = link.length
+                cable_data[_K_LENGTH_UNIT] = link.length_unit or DEFAULT_LENGTH_UNIT
+
+            log(f"[CABLE:4] Queueing cable payload: {cable_data}")
+            pending_cables.append((
+                cable_data,
+                f"{device_name}:{port_cfg.name} → {link.peer_device}:{link.peer_port}",
+            ))
 
-            console.print(f"[CABLE:4] Creating cable payload: {cable_data}")
+        log.flush()
+
+        # ------------------------------------------------------------------
+        # 4. Create all queued cables in bulk
+        # ------------------------------------------------------------------
+        self._flush_cable_creates(pending_cables)
+
+    def _flush_cable_creates(self, pending: List[Tuple[dict, str]]):
+        """
+        Create queued cables with bulk POSTs of CABLE_BULK_CHUNK_SIZE.
 
-            created_cable = None
+        NetBox creates a bulk request atomically, so a failed chunk is retried
+        cable by cable to keep one bad link from blocking the others.
+
+        Args:
+            pending: List of (cable payload, log label) tuples
+        """
+        cables_api = self.client.nb.dcim.cables
+
+        for start in range(0, len(pending), CABLE_BULK_CHUNK_SIZE):
+            chunk = pending[start:start + CABLE_BULK_CHUNK_SIZE]
             try:
-                # FIXED: Use proper pynetbox method
-                created_cable = self.client.nb.dcim.cables.create(cable_data)
-                
-                if created_cable and hasattr(created_cable, 'id') and created_cable.id:
-                    console.print(
-                        f"[green]+ Cable {created_cable.id}:[/green] "
-                        f"{device_name}:{port_cfg.name} → "
-                        f"{link.peer_device}:{link.peer_port}"
-                    )
-                else:
-                    console.print(
-                        f"[red]Cable creation returned invalid response for "
-                        f"{device_name}:{port_cfg.name} → {link.peer_device}:{link.peer_port}[/red]"
-                    )
-                    
+                created = cables_api.create([cable_data for cable_data, _ in chunk])
+                for cable, (_, label) in zip(created or [], chunk):
+                    console.print(f"[green]+ Cable {cable.id}:[/green] {label}")
+                continue
             except Exception as e:
-                console.print(
-                    f"[red bold]FAILED to create cable "
-                    f"{device_name}:{port_cfg.name} → {link.peer_device}:{link.peer_port}[/red bold]"
-                )
-                console.print(f"[red]Error: {e}[/red]")
-                console.print(f"[red]Payload was: {cable_data}[/red]")
\ No newline at end of file
+                log_warning(f"{LOG_PREFIX_CABLE} Bulk create of {len(chunk)} cables failed ({e}), retrying individually")
+
+            for cable_data, label in chunk:
+                try:
+                    created_cable = cables_api.create(cable_data)
+
+                    if created_cable and hasattr(created_cable, 'id') and created_cable.id:
+                        console.print(f"[green]+ Cable {created_cable.id}:[/green] {label}")
+                    else:
+                        console.print(f"[red]Cable creation returned invalid response for {label}[/red]")
+
+                except Exception as e:
+                    console.print(f"[red bold]FAILED to create cable {label}[/red bold]")
+                    console.print(f"[red]Error: {e}[/red]")
+                    console.print(f"[red]Payload was: {cable_data}[/red]")
@@ -1,8 +1,9 @@
 """Data loader for loading YAML files and validating with Pydantic models."""
 
+import os
 import yaml
 from pathlib import Path
-from typing import List, Type, TypeVar
+from typing import Iterator, List, Type, TypeVar
 from pydantic import BaseModel
 from rich.console import Console
 
@@ -11,6 +12,30 @@ console = Console()
 # Type variable for Pydantic models
 T = TypeVar('T', bound=BaseModel)
 
+# File extensions picked up by the loader
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+
+def _iter_yaml(root: str) -> Iterator[str]:
+    """
+    Recursively yield paths of YAML files below a directory.
+
+    Uses os.scandir() so directory entries come back pre-stat'd and no
+    Path objects are built for every traversed entry.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Path of each .yaml/.yml file
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_yaml(entry.path)
+            elif entry.is_file() and entry.name.endswith(YAML_EXTENSIONS):
+                yield entry.path
+
 
 class DataLoader:
     """Load and validate YAML configuration files."""
@@ -26,7 +51,7 @@ class DataLoader:
 
     def load_from_folder(self, subfolder: str, model: Type[T]) -> List[T]:
         """
-        Recursively load .yaml files from a folder and validate them.
+        Recursively load .yaml/.yml files from a folder and validate them.
 
         Args:
             subfolder: Relative path to the folder containing YAML files
@@ -46,7 +71,7 @@ class DataLoader:
             console.print(f"[yellow]Warning: Folder {subfolder} not found.[/yellow]")
             return []
 
-        files: List[Path] = list(target_dir.rglob("*.yaml"))
+        files: List[str] = list(_iter_yaml(str(target_dir)))
 
         for file_path in files:
             with open(file_path, "r", encoding="utf-8") as f:
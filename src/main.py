@@ -1,48 +1,12 @@
 import typer
 import os
 import sys
-import urllib3
-import pynetbox
+from operator import attrgetter
 from dotenv import load_dotenv
 from rich.console import Console
 
-# Import Loader
-from src.loader import DataLoader
-
-# ==========================================
-# 1. IMPORT MODELS
-# ==========================================
-from src.models import (
-    # Foundation Models
-    SiteModel, 
-    RackModel, 
-    VlanModel, 
-    VlanGroupModel,
-    VRFModel,        
-    TagModel,
-    ModuleTypeModel, 
-    DeviceTypeModel, 
-    RoleModel,
-    PrefixModel,
-    
-    # Device Models (Strict Mode for Controller)
-    DeviceConfig
-)
-
-# ==========================================
-# 2. IMPORT SYNCERS (LEGACY & NEW)
-# ==========================================
-# Legacy Syncers (for Foundation & Network)
-from src.syncers.dcim import DCIMSyncer
-from src.syncers.ipam import IPAMSyncer
-from src.syncers.extras import ExtrasSyncer
-from src.syncers.module_types import ModuleTypeSyncer
-from src.syncers.device_types import DeviceTypeSyncer
-from src.syncers.roles import RoleSyncer
-
-# New Controller (for Devices & Cables)
-from src.client import NetBoxClient
-from src.controllers.device_controller import DeviceController
+# NOTE: Loader, models, syncers and clients are imported lazily inside
+# run_sync() so that `--help` does not pay for pynetbox/Pydantic imports.
 
 load_dotenv()
 
@@ -58,7 +22,47 @@ def run_sync(dry_run: bool = False):
     Phase 2: Network & Types (VLANs, VRFs, Device Types, Module Types)
     Phase 3: Devices & Cables (Controller Engine - High Performance)
     """
-    
+    import urllib3
+    import pynetbox
+
+    # Import Loader
+    from src.loader import DataLoader
+
+    # ==========================================
+    # 1. IMPORT MODELS
+    # ==========================================
+    from src.models import (
+        # Foundation Models
+        SiteModel, 
+        RackModel, 
+        VlanModel, 
+        VlanGroupModel,
+        VRFModel,        
+        TagModel,
+        ModuleTypeModel, 
+        DeviceTypeModel, 
+        RoleModel,
+        PrefixModel,
+        
+        # Device Models (Strict Mode for Controller)
+        DeviceConfig
+    )
+
+    # ==========================================
+    # 2. IMPORT SYNCERS (LEGACY & NEW)
+    # ==========================================
+    # Legacy Syncers (for Foundation & Network)
+    from src.syncers.dcim import DCIMSyncer
+    from src.syncers.ipam import IPAMSyncer
+    from src.syncers.extras import ExtrasSyncer
+    from src.syncers.module_types import ModuleTypeSyncer
+    from src.syncers.device_types import DeviceTypeSyncer
+    from src.syncers.roles import RoleSyncer
+
+    # New Controller (for Devices & Cables)
+    from src.client import NetBoxClient, create_http_session
+    from src.controllers.device_controller import DeviceController
+
     # Suppress SSL warnings
     urllib3.disable_warnings()
     
@@ -73,12 +77,16 @@ def run_sync(dry_run: bool = False):
     # INITIALIZE CLIENTS
     # =========================================================================
     
+    # One pooled keep-alive session shared by both clients
+    http_session = create_http_session()
+
     # Legacy Client (for Phase 1 & 2)
-    nb = pynetbox.api(url, token=token)
-    nb.http_session.verify = False 
+    # threading=True: multi-page list fetches request the remaining pages concurrently
+    nb = pynetbox.api(url, token=token, threading=True)
+    nb.http_session = http_session
     
     # New Client (for Phase 3 - Devices & Cables)
-    new_client = NetBoxClient(url, token, dry_run=dry_run)
+    new_client = NetBoxClient(url, token, dry_run=dry_run, http_session=http_session)
     
     # =========================================================================
     # 1. LOAD DATA
@@ -137,6 +145,11 @@ def run_sync(dry_run: bool = False):
         # PHASE 2: NETWORK & TYPES (Legacy Engine)
         # =====================================================================
         console.rule("[bold cyan]Phase 2: Network & Types[/bold cyan]")
+        # Warm lookup caches (sites, VRFs, manufacturers, ...) concurrently,
+        # after Phase 1 so freshly created sites are included
+        for syncer in (ipam, mt_syncer, type_syncer):
+            syncer.prewarm_cache(syncer.CACHE_ENDPOINTS)
+
         ipam.sync_vrfs(vrfs)                
         ipam.sync_vlan_groups(vlan_groups) 
         ipam.sync_vlans(vlans)
@@ -155,11 +168,11 @@ def run_sync(dry_run: bool = False):
         new_client.reload_global_cache()
 
         # 2. Load site-specific caches (for all sites used)
-        unique_sites = set(dev.site_slug for dev in all_devices)
-        console.print(f"[cyan]Loading site caches for: {', '.join(sorted(unique_sites))}[/cyan]")
+        _site = attrgetter("site_slug")
+        unique_sites = sorted(dict.fromkeys(map(_site, all_devices)))
+        console.print(f"[cyan]Loading site caches for: {', '.join(unique_sites)}[/cyan]")
 
-        for site_slug in sorted(unique_sites):
-            new_client.reload_cache(site_slug)
+        new_client.reload_site_caches(unique_sites)
 
         # 3. Initialize controller
         controller = DeviceController(new_client)
@@ -1,5 +1,7 @@
 from typing import Optional, Literal, List, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from src.utils import slugify
 
 
 # =========================================================
@@ -45,8 +47,10 @@ class VRFModel(BaseModel):
     enforce_unique: bool = True
     tags: List[str] = []
     
+    # Computed field: included in payload dumps (NetBox requires a slug)
+    @computed_field
     @property
-    def slug(self):
+    def slug(self) -> str:
         return self.name.lower().replace(" ", "-")
 
 class VlanGroupModel(BaseModel):
@@ -116,6 +120,11 @@ class ModuleTypeModel(BaseModel):
     description: Optional[str] = None
     tags: List[str] = []
 
+    @property
+    def manufacturer_slug(self) -> str:
+        # Plain property (not a computed field): must not end up in the payload
+        return slugify(self.manufacturer)
+
 class DeviceTypeModel(BaseModel):
     """Device Type Definition (Blueprint for devices)."""
     model: str
@@ -132,6 +141,11 @@ class DeviceTypeModel(BaseModel):
     module_bays: List[ModuleBayTemplateModel] = []
     device_bays: List[DeviceBayTemplateConfig] = []
 
+    @property
+    def manufacturer_slug(self) -> str:
+        # Plain property (not a computed field): must not end up in the payload
+        return slugify(self.manufacturer)
+
 
 # =========================================================
 # DEVICE INSTANCE MODELS (Controller - Konkrete Geräte)
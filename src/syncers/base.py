@@ -1,3 +1,8 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pynetbox
 from pynetbox.core.response import Record
 from rich.console import Console
@@ -6,9 +11,16 @@ from src.constants import (
     MANAGED_TAG_SLUG,
     TEMPLATE_ENDPOINTS,
     FIELD_TRANSFORMS,
+    PREWARM_MAX_WORKERS,
+    DELETE_MAX_WORKERS,
+    ENSURE_MAX_WORKERS,
+    DISK_CACHE_DIR_ENV,
 )
 from src.utils import (
     get_id_from_object,
+    has_managed_tag,
+    unique_by,
+    filter_chunked,
     log_error,
     log_warning,
     log_success,
@@ -19,6 +31,34 @@ from src.utils import (
 
 console = Console()
 
+# Sentinel for attributes missing on an existing object
+_MISS = object()
+
+
+def _coerce(value):
+    """
+    Normalize a value for the shallow equality probe in _compute_changes.
+
+    Nested Records collapse to their ID (foreign keys) or value (choices),
+    strings compare case-insensitively.
+    """
+    if isinstance(value, Record):
+        attrs = value.__dict__
+        value = attrs['id'] if 'id' in attrs else attrs.get('value', value)
+    if isinstance(value, str):
+        return value.lower()
+    return value
+
+
+# Tag normalization for _prepare_payload, dispatched on the exact builtin type.
+# Each handler returns (normalized_tag, is_managed_tag).
+_TAG_HANDLERS = {
+    int: lambda t, managed_id: (t, t == managed_id),
+    dict: lambda t, managed_id: (t, t.get('slug') == MANAGED_TAG_SLUG),
+    str: lambda t, managed_id: ({'slug': t}, t == MANAGED_TAG_SLUG),
+}
+
+
 class BaseSyncer:
     """
     Base syncer class for legacy NetBox resource synchronization.
@@ -34,6 +74,9 @@ class BaseSyncer:
     - NOT ideal for concurrent goroutines (race conditions on cache writes)
     - New Go code should use EAGER loading (see NetBoxClient)
     - Keep this strategy only for legacy Python syncers that run sequentially
+    - Subclasses list their lookup endpoints in CACHE_ENDPOINTS; the orchestrator
+      can fetch them all concurrently via prewarm_cache() before syncing, with
+      _get_cached_id() remaining the lazy fallback
 
     TAG MANAGEMENT:
     ==============
@@ -42,6 +85,9 @@ class BaseSyncer:
     - Injects managed tag via _prepare_payload() for all resources
     """
 
+    # (app, endpoint) pairs this syncer resolves via _get_cached_id()
+    CACHE_ENDPOINTS: tuple = ()
+
     def __init__(self, nb, managed_tag_id: int, dry_run: bool = False):
         """
         Initialize base syncer.
@@ -53,8 +99,27 @@ class BaseSyncer:
         """
         self.nb = nb
         self.dry_run = dry_run
-        self.cache = {}
+        self.cache: dict[tuple[str, str], dict[str, int]] = {}
         self.managed_tag_id = managed_tag_id
+        self._endpoint_cache = {}
+        # (app, endpoint) -> {'foo_id': 'foo'} key renames for diffing
+        self._id_strip_map: dict[tuple[str, str], dict[str, str]] = {}
+        # (app, endpoint_name, desired keys) -> specialized diff function
+        self._cmp_cache = {}
+        # Persistent lookup cache directory (opt-in, see DISK_CACHE_DIR_ENV)
+        self.disk_cache_dir = os.getenv(DISK_CACHE_DIR_ENV) or None
+    def _endpoint(self, app: str, endpoint: str):
+        """
+        Resolve (and memoize) a pynetbox Endpoint, e.g. ('dcim', 'sites') -> nb.dcim.sites.
+
+        pynetbox builds new App/Endpoint objects on every attribute access,
+        so hot loops reuse the resolved instance instead.
+        """
+        key = (app, endpoint)
+        api_obj = self._endpoint_cache.get(key)
+        if api_obj is None:
+            api_obj = self._endpoint_cache[key] = getattr(getattr(self.nb, app), endpoint)
+        return api_obj
 
     def _get_cached_id(self, app: str, endpoint: str, identifier: str) -> int | None:
         """
@@ -88,25 +153,254 @@ class BaseSyncer:
         if not identifier:
             return None
 
-        key = f"{app}.{endpoint}"
+        key = (app, endpoint)
         if key not in self.cache:
-            api_obj = getattr(getattr(self.nb, app), endpoint)
             try:
-                all_items = api_obj.all(limit=0)
-                self.cache[key] = {}
-                for item in all_items:
-                    slug = getattr(item, 'slug', None)
-                    name = getattr(item, 'name', getattr(item, 'model', getattr(item, 'prefix', None)))
-                    ref = slug if slug else name
-                    if ref:
-                        self.cache[key][str(ref)] = item.id
-                    if slug and name:
-                        self.cache[key][str(name)] = item.id
+                self.cache[key] = self._load_index(app, endpoint)
             except Exception as e:
-                log_error(f"Cache Error {key}", e)
+                log_error(f"Cache Error {app}.{endpoint}", e)
                 self.cache[key] = {}
 
-        return self.cache[key].get(str(identifier))
+        # Identifiers are nearly always slugs/names already: skip the str() call
+        return self.cache[key].get(identifier if type(identifier) is str else str(identifier))
+
+    def _fetch_all(self, app: str, endpoint: str) -> list:
+        """Fetch every object of an endpoint (all pages)."""
+        return list(self._endpoint(app, endpoint).all(limit=0))
+
+    def _load_index(self, app: str, endpoint: str) -> dict:
+        """
+        Load the slug/name -> ID map of an endpoint, reusing the on-disk copy if possible.
+
+        Without a disk cache directory (see DISK_CACHE_DIR_ENV) this is a
+        plain paginated fetch. Otherwise two cheap metadata queries (object
+        count and newest last_updated) form the endpoint signature. If it
+        matches the stored one, the full paginated fetch is skipped.
+        Otherwise only the objects changed since the stored signature are
+        fetched and merged (see _refresh_index), falling back to a full fetch
+        if objects were deleted. Disk errors are never fatal.
+
+        Args:
+            app: NetBox app (e.g., 'dcim', 'ipam')
+            endpoint: API endpoint
+
+        Returns:
+            Dictionary mapping slug and name to object ID
+        """
+        if not self.disk_cache_dir:
+            return self._fetch_index(app, endpoint)
+
+        api_obj = self._endpoint(app, endpoint)
+        path = self._disk_cache_path(app, endpoint)
+
+        signature = None
+        try:
+            newest = next(iter(api_obj.filter(ordering='-last_updated', limit=1, offset=0)), None)
+            signature = [api_obj.count(), getattr(newest, 'last_updated', None)]
+        except Exception as e:
+            log_debug(f"Disk cache signature unavailable for {app}.{endpoint}: {e}")
+
+        index = None
+        if signature is not None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+                if stored.get('signature') == signature:
+                    return stored['index']
+                index = self._refresh_index(app, endpoint, stored, signature[0])
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            except Exception as e:
+                log_debug(f"Disk cache delta refresh failed for {app}.{endpoint}: {e}")
+
+        if index is None:
+            index = self._fetch_index(app, endpoint)
+
+        if signature is not None:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'signature': signature, 'index': index}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                # Unwritable cache directory: continue without disk caching
+                log_warning(f"Disk cache disabled, could not write {path}: {e}")
+                self.disk_cache_dir = None
+
+        return index
+
+    def _fetch_index(self, app: str, endpoint: str) -> dict:
+        """Fetch all objects of an endpoint and build its slug/name -> ID map."""
+        items = self._fetch_all(app, endpoint)
+        if items:
+            self._strip_map_for(app, endpoint, items[0])
+        return self._index_items(items)
+
+    def _refresh_index(self, app: str, endpoint: str, stored: dict, count: int) -> dict | None:
+        """
+        Bring a stale disk cache index up to date with a delta fetch.
+
+        Only objects with last_updated at or after the stored newest timestamp
+        are fetched; their old keys are dropped (renames) and re-indexed.
+        Deletions are invisible to the delta query, so the result is only used
+        if the stored count plus the newly seen objects matches the live count.
+
+        Args:
+            app: NetBox app
+            endpoint: API endpoint
+            stored: Disk cache content ({'signature': [...], 'index': {...}})
+            count: Current object count of the endpoint
+
+        Returns:
+            Updated index, or None if a full fetch is required
+        """
+        stored_count, stored_newest = stored['signature']
+        if not stored_newest:
+            return None
+
+        changed = list(self._endpoint(app, endpoint).filter(last_updated__gte=stored_newest))
+        changed_ids = {item.id for item in changed}
+        index = stored['index']
+        new_ids = changed_ids.difference(index.values())
+        if stored_count + len(new_ids) != count:
+            return None
+
+        if changed:
+            self._strip_map_for(app, endpoint, changed[0])
+        index = {key: obj_id for key, obj_id in index.items() if obj_id not in changed_ids}
+        index.update(self._index_items(changed))
+        log_debug(f"Disk cache for {app}.{endpoint}: refreshed {len(changed)} changed object(s)")
+        return index
+
+    def _disk_cache_path(self, app: str, endpoint: str) -> str:
+        """Disk cache file for an endpoint, namespaced by NetBox instance."""
+        instance = hashlib.sha1(str(getattr(self.nb, 'base_url', '')).encode()).hexdigest()[:12]
+        return os.path.join(os.path.expanduser(self.disk_cache_dir), f"{instance}-{app}.{endpoint}.json")
+
+    def _strip_map_for(self, app: str, endpoint: str, sample_obj) -> dict:
+        """
+        Get the foo_id -> foo key mapping of an endpoint, built once per endpoint.
+
+        Desired data uses API write names (site_id) while fetched Records carry
+        the nested object (site). The mapping is derived from the attribute
+        keys of one sample Record, replacing two hasattr() calls per key and
+        diff with a dict lookup.
+        """
+        key = (app, endpoint)
+        strip_map = self._id_strip_map.get(key)
+        if strip_map is None:
+            keys = sample_obj.__dict__.keys()
+            strip_map = self._id_strip_map[key] = {
+                f"{k}_id": k for k in keys if f"{k}_id" not in keys
+            }
+        return strip_map
+
+    @staticmethod
+    def _index_items(items) -> dict:
+        """
+        Build a lookup map (slug/name -> ID) from NetBox objects.
+
+        Args:
+            items: Iterable of pynetbox Records
+
+        Returns:
+            Dictionary mapping slug and name to object ID
+        """
+        index = {}
+        for item in items:
+            # Records keep their fields in __dict__: plain dict lookups avoid
+            # getattr() defaults (and pynetbox's lazy full_details() fetch)
+            d = item.__dict__
+            slug = d.get('slug')
+            name = d.get('name') or d.get('model') or d.get('prefix')
+            ref = slug if slug else name
+            if ref:
+                index[ref if type(ref) is str else str(ref)] = item.id
+            if slug and name:
+                index[name if type(name) is str else str(name)] = item.id
+        return index
+
+    def prewarm_cache(self, endpoint_specs) -> None:
+        """
+        Eagerly load lookup caches for several endpoints in parallel.
+
+        Fetching is I/O-bound, so firing all endpoint requests concurrently
+        reduces warm-up latency from the sum to roughly the slowest endpoint.
+        Endpoints that fail to load are left unset so _get_cached_id() can
+        retry them lazily.
+
+        Args:
+            endpoint_specs: Iterable of (app, endpoint) tuples
+        """
+        specs = [spec for spec in dict.fromkeys(map(tuple, endpoint_specs))
+                 if spec not in self.cache]
+        if not specs:
+            return
+
+        with ThreadPoolExecutor(max_workers=PREWARM_MAX_WORKERS) as executor:
+            futures = {spec: executor.submit(self._load_index, *spec) for spec in specs}
+
+        for key, future in futures.items():
+            try:
+                self.cache[key] = future.result()
+            except Exception as e:
+                log_error(f"Cache Error {key[0]}.{key[1]}", e)
+
+    @staticmethod
+    def _index_key(obj, key_fields: tuple):
+        """
+        Build the prefetch index key of an object.
+
+        Fields are read from the Record's attribute dict; 'foo_id' fields fall
+        back to the ID of the nested 'foo' object (None if unset). Single-field
+        keys are plain values, multi-field keys tuples.
+        """
+        attrs = obj.__dict__
+        values = []
+        for field in key_fields:
+            if field in attrs:
+                value = attrs[field]
+            elif field.endswith('_id'):
+                value = get_id_from_object(attrs.get(field[:-3]))
+            else:
+                value = None
+            values.append(value)
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def prefetch_endpoint(self, app: str, endpoint: str, key_fields: tuple, **filters) -> dict | None:
+        """
+        Fetch the existing objects of an endpoint once and index them in memory.
+
+        Replaces one lookup GET per object with a few (paginated) requests.
+        The index is handed to bulk_ensure()/ensure_objects() for the same
+        objects, where a miss means "create" without another GET. Filters
+        must therefore cover every object that will be ensured.
+
+        Multi-valued filters are sent in bounded chunks (see filter_chunked),
+        so large inventories don't exceed URI length limits.
+
+        Args:
+            app: NetBox app
+            endpoint: API endpoint
+            key_fields: Lookup fields forming the key, e.g. ('prefix', 'vrf_id')
+            **filters: Optional API filters (multi-valued lists allowed);
+                the whole collection is fetched if omitted
+
+        Returns:
+            Dictionary mapping key -> object, or None if the fetch failed
+        """
+        api_obj = self._endpoint(app, endpoint)
+        index = {}
+        try:
+            items = filter_chunked(api_obj, **filters) if filters else api_obj.all(limit=0)
+            for obj in items:
+                index[self._index_key(obj, key_fields)] = obj
+        except Exception as e:
+            log_error(f"Prefetch Error {app}.{endpoint}", e)
+            return None
+
+        return index
 
     def _prepare_payload(self, data: dict) -> dict:
         """
@@ -118,26 +412,30 @@ class BaseSyncer:
         Returns:
             Cleaned payload with managed tag
         """
+        tags = data.get('tags')
+
+        # Fast paths: no tags at all, or already a plain ID list with the managed tag
+        if tags is None:
+            payload = data.copy()
+            payload['tags'] = [self.managed_tag_id] if self.managed_tag_id else []
+            return payload
+        if (type(tags) is list and self.managed_tag_id in tags
+                and all(type(t) is int for t in tags)):
+            return data.copy()
+
         payload = data.copy()
 
-        current_tags = payload.get('tags', [])
         normalized_tags = []
         has_gitops = False
 
-        # Convert everything to IDs where possible
-        for t in current_tags:
-            if isinstance(t, int):
-                normalized_tags.append(t)
-                if t == self.managed_tag_id:
-                    has_gitops = True
-            elif isinstance(t, dict):
-                if t.get('slug') == MANAGED_TAG_SLUG:
-                    has_gitops = True
-                normalized_tags.append(t)
-            elif isinstance(t, str):
-                if t == MANAGED_TAG_SLUG:
-                    has_gitops = True
-                normalized_tags.append({'slug': t})
+        # Convert everything to IDs where possible (unknown types are dropped)
+        for t in tags:
+            handler = _TAG_HANDLERS.get(type(t))
+            if handler is None:
+                continue
+            tag, is_managed = handler(t, self.managed_tag_id)
+            normalized_tags.append(tag)
+            has_gitops = has_gitops or is_managed
 
         if not has_gitops and self.managed_tag_id:
             normalized_tags.append(self.managed_tag_id)
@@ -145,97 +443,206 @@ class BaseSyncer:
         payload['tags'] = normalized_tags
         return payload
 
-    def _diff_and_update(self, existing_obj, desired_data: dict, endpoint_name: str = "object") -> bool:
+    def _compute_changes(self, existing_obj, desired_data: dict, endpoint_name: str = "object",
+                         strip_map: dict | None = None, app: str | None = None) -> dict | None:
         """
-        Compare existing object with desired data and update if different.
+        Compare existing object with desired data and collect the differences.
 
         Args:
             existing_obj: Existing NetBox object
             desired_data: Desired state dictionary
-            endpoint_name: Name for logging
+            endpoint_name: Endpoint name (racks get special slug handling)
+            strip_map: Optional precomputed foo_id -> foo mapping (see _strip_map_for);
+                derived from existing_obj when omitted
+            app: NetBox app of the endpoint; part of the comparator cache key,
+                since strip maps are per (app, endpoint)
 
         Returns:
-            True if updated, False otherwise
+            Dictionary of changed fields, or None if the object is up to date
         """
-        changes = {}
+        # Fast path: steady-state re-runs mostly hit unchanged objects, so probe
+        # all non-tag fields with cheap normalization first and only fall
+        # through to the detailed per-key comparison on a mismatch.
+        if self._probe_matches(existing_obj, desired_data, endpoint_name):
+            desired_tags = desired_data.get('tags')
+            if desired_tags is not None and self._tags_differ(existing_obj, desired_tags):
+                return {'tags': desired_tags}
+            return None
 
-        for key, desired_value in desired_data.items():
-            # Skip slug for racks (special case)
-            if key == 'slug' and endpoint_name == 'racks':
-                continue
-            if desired_value is None:
-                continue
+        # Detailed comparison via a per-endpoint specialized comparator
+        if strip_map is None:
+            # No endpoint map given: derive one from this object, uncached
+            keys = existing_obj.__dict__.keys()
+            strip_map = {f"{k}_id": k for k in keys if f"{k}_id" not in keys}
+            compare = self._make_comparator(endpoint_name, tuple(desired_data), strip_map)
+        else:
+            cmp_key = (app, endpoint_name, tuple(desired_data))
+            compare = self._cmp_cache.get(cmp_key)
+            if compare is None:
+                compare = self._cmp_cache[cmp_key] = self._make_comparator(
+                    endpoint_name, cmp_key[2], strip_map
+                )
+
+        return compare(existing_obj, desired_data) or None
 
-            # Key mapping (foo_id -> foo)
-            check_key = key
-            if key.endswith('_id') and not hasattr(existing_obj, key):
-                candidate = key[:-3]
-                if hasattr(existing_obj, candidate):
-                    check_key = candidate
+    def _make_comparator(self, endpoint_name: str, keys: tuple, strip_map: dict):
+        """
+        Build a diff function specialized for one endpoint and desired key set.
+
+        Everything that only depends on the key set (rack slug skip, foo_id -> foo
+        renames, tag handling) is resolved once here; the returned closure only
+        normalizes and compares values.
 
-            current_value = getattr(existing_obj, check_key, None)
+        Args:
+            endpoint_name: Endpoint name (racks get special slug handling)
+            keys: Desired data keys, in payload order
+            strip_map: foo_id -> foo mapping for the endpoint
+
+        Returns:
+            Callable (existing_obj, desired_data) -> dict of changed fields
+        """
+        plan = tuple(
+            (key, strip_map.get(key, key), key == 'tags')
+            for key in keys
+            # Skip slug for racks (special case)
+            if not (key == 'slug' and endpoint_name == 'racks')
+        )
+        tags_differ = self._tags_differ
+
+        def compare(existing_obj, desired_data: dict) -> dict:
+            changes = {}
+            for key, check_key, is_tags in plan:
+                desired_value = desired_data[key]
+                if desired_value is None:
+                    continue
 
-            # --- 1. TAGS ---
-            if key == 'tags':
-                # IMPORTANT: Templates don't have tags, must check if attribute exists
-                if not hasattr(existing_obj, 'tags'):
+                # --- 1. TAGS ---
+                if is_tags:
+                    if tags_differ(existing_obj, desired_value):
+                        changes[key] = desired_value
                     continue
 
-                current_ids = set()
-                if current_value:
-                    for t in current_value:
-                        tid = get_id_from_object(t)
-                        if tid:
-                            current_ids.add(tid)
-
-                desired_ids = set()
-                for t in desired_value:
-                    tid = get_id_from_object(t)
-                    if tid:
-                        desired_ids.add(tid)
-                    elif isinstance(t, dict) and t.get('slug') == MANAGED_TAG_SLUG:
-                        desired_ids.add(self.managed_tag_id)
-
-                if current_ids != desired_ids:
+                current_value = getattr(existing_obj, check_key, None)
+
+                # --- 2. FOREIGN KEYS ---
+                if isinstance(desired_value, int):
+                    cur_id = get_id_from_object(current_value)
+                    if cur_id is not None:
+                        current_value = cur_id
+
+                # --- 3. STATUS / CHOICES ---
+                if hasattr(current_value, 'value'):
+                    current_value = current_value.value
+
+                # --- 4. PRIMITIVE NORMALIZATION ---
+                if current_value is None and desired_value == "":
+                    current_value = ""
+                if current_value == "" and desired_value is None:
+                    desired_value = ""
+
+                if isinstance(current_value, str) and isinstance(desired_value, str):
+                    if current_value.lower() == desired_value.lower():
+                        continue
+
+                if current_value != desired_value:
                     changes[key] = desired_value
-                continue
+            return changes
 
-            # --- 2. FOREIGN KEYS ---
-            if isinstance(desired_value, int):
-                cur_id = get_id_from_object(current_value)
-                if cur_id is not None:
-                    current_value = cur_id
+        return compare
 
-            # --- 3. STATUS / CHOICES ---
-            if hasattr(current_value, 'value'):
-                current_value = current_value.value
+    @staticmethod
+    def _probe_matches(existing_obj, desired_data: dict, endpoint_name: str) -> bool:
+        """
+        Cheap equality check of all non-tag desired fields against an object.
 
-            # --- 4. PRIMITIVE NORMALIZATION ---
-            if current_value is None and desired_value == "":
-                current_value = ""
-            if current_value == "" and desired_value is None:
-                desired_value = ""
+        Only reads the object's attribute dict (no lazy pynetbox fetches).
+        A True result guarantees the detailed comparison would find no
+        change; False just means the detailed comparison has to run.
+        """
+        attrs = existing_obj.__dict__
+        for key, desired_value in desired_data.items():
+            if desired_value is None or key == 'tags':
+                continue
+            if key == 'slug' and endpoint_name == 'racks':
+                continue
+            if _coerce(attrs.get(key, _MISS)) != _coerce(desired_value):
+                return False
+        return True
 
-            if isinstance(current_value, str) and isinstance(desired_value, str):
-                if current_value.lower() == desired_value.lower():
-                    continue
+    def _tags_differ(self, existing_obj, desired_tags: list) -> bool:
+        """
+        Compare tag IDs of an existing object with the desired tag list.
 
-            if current_value != desired_value:
-                changes[key] = desired_value
+        Args:
+            existing_obj: Existing NetBox object
+            desired_tags: Desired tags (IDs, dicts or Records)
 
-        if changes:
-            display_name = getattr(existing_obj, 'name', getattr(existing_obj, 'model', 'Item'))
-            if self.dry_run:
-                log_dry_run("UPDATE", f"{endpoint_name} {display_name}: {list(changes.keys())}")
-            else:
-                try:
-                    existing_obj.update(changes)
-                    return True
-                except Exception as e:
-                    log_error(f"Failed to update {display_name}", e)
+        Returns:
+            True if the tag sets differ
+        """
+        # IMPORTANT: Templates don't have tags, must check if attribute exists
+        if not hasattr(existing_obj, 'tags'):
+            return False
+
+        current_ids = set()
+        current_value = existing_obj.tags
+        if current_value:
+            for t in current_value:
+                tid = get_id_from_object(t)
+                if tid:
+                    current_ids.add(tid)
+
+        desired_ids = set()
+        for t in desired_tags:
+            tid = get_id_from_object(t)
+            if tid:
+                desired_ids.add(tid)
+            elif isinstance(t, dict) and t.get('slug') == MANAGED_TAG_SLUG:
+                desired_ids.add(self.managed_tag_id)
+
+        return current_ids != desired_ids
+
+    def _diff_and_update(self, existing_obj, desired_data: dict, endpoint_name: str = "object",
+                         defer: list | None = None, strip_map: dict | None = None,
+                         app: str | None = None) -> bool:
+        """
+        Compare existing object with desired data and update if different.
+
+        Args:
+            existing_obj: Existing NetBox object
+            desired_data: Desired state dictionary
+            endpoint_name: Name for logging
+            defer: Optional batch list; if given, changes are appended as
+                {'id': ..., **changes} for a later bulk PATCH instead of
+                being sent immediately
+            strip_map: Optional precomputed foo_id -> foo mapping (see _strip_map_for)
+            app: NetBox app of the endpoint (see _compute_changes)
+
+        Returns:
+            True if updated (or queued for update), False otherwise
+        """
+        changes = self._compute_changes(existing_obj, desired_data, endpoint_name, strip_map, app)
+        if not changes:
+            return False
+
+        display_name = getattr(existing_obj, 'name', getattr(existing_obj, 'model', 'Item'))
+        if self.dry_run:
+            log_dry_run("UPDATE", f"{endpoint_name} {display_name}: {list(changes.keys())}")
+            return False
+
+        if defer is not None:
+            defer.append({'id': existing_obj.id, **changes})
+            return True
+
+        try:
+            existing_obj.update(changes)
+            return True
+        except Exception as e:
+            log_error(f"Failed to update {display_name}", e)
         return False
 
-    def ensure_object(self, app: str, endpoint: str, lookup_data: dict, create_data: dict):
+    def ensure_object(self, app: str, endpoint: str, lookup_data: dict, create_data: dict,
+                      defer: list | None = None, existing: dict | None = None):
         """
         Ensure an object exists, creating or updating as needed.
 
@@ -244,18 +651,27 @@ class BaseSyncer:
             endpoint: API endpoint
             lookup_data: Criteria to find existing object
             create_data: Data to create/update
+            defer: Optional batch list for updates (see _diff_and_update)
+            existing: Optional prefetched objects (see prefetch_endpoint) keyed
+                by the lookup values in lookup order; replaces the lookup GET,
+                so it must cover this lookup
 
         Returns:
             Created or updated object, or None on error/dry-run
         """
-        api_obj = getattr(getattr(self.nb, app), endpoint)
+        api_obj = self._endpoint(app, endpoint)
 
         # Special handling for racks
         if endpoint == 'racks' and 'slug' in lookup_data:
             lookup_data = {'site_id': lookup_data.get('site_id'), 'name': create_data['name']}
 
+        # Prefetched index (see prefetch_endpoint) replaces the lookup GET
         exists = None
-        if not (self.dry_run and 0 in lookup_data.values()):
+        if existing is not None:
+            values = tuple(lookup_data.values())
+            index_key = values[0] if len(values) == 1 else values
+            exists = existing.get(index_key)
+        elif not (self.dry_run and 0 in lookup_data.values()):
             try:
                 exists = api_obj.get(**lookup_data)
             except ValueError:
@@ -282,21 +698,154 @@ class BaseSyncer:
                     name = getattr(new_obj, 'name', getattr(new_obj, 'model', getattr(new_obj, 'prefix', None)))
                     ref = slug if slug else name
                     self._update_cache(app, endpoint, ref, new_obj.id)
+                    if existing is not None:
+                        existing[index_key] = new_obj
                     return new_obj
                 except Exception as e:
                     log_error(f"Failed to create {display_name}", e)
                     return None
         else:
-            self._diff_and_update(exists, final_payload, endpoint)
+            self._diff_and_update(exists, final_payload, endpoint, defer=defer,
+                                  strip_map=self._strip_map_for(app, endpoint, exists), app=app)
             return exists
 
     def ensure_object_and_return(self, app, endpoint, lookup_data, create_data):
         return self.ensure_object(app, endpoint, lookup_data, create_data)
 
+    def ensure_objects(self, app: str, endpoint: str, items: list, existing: dict | None = None) -> list:
+        """
+        Run ensure_object() for many independent objects concurrently.
+
+        Each ensure_object() is a lookup GET plus a possible POST/PATCH, so
+        keeping several in flight on the pooled session overlaps the round
+        trips. Items with the same lookup are deduplicated first (first one
+        wins, like unique_by() everywhere else) so two workers never race to
+        create the same object.
+
+        Args:
+            app: NetBox app
+            endpoint: API endpoint
+            items: List of (lookup_data, create_data) tuples
+            existing: Optional prefetched objects for these items (see
+                ensure_object); None looks each object up with a GET
+
+        Returns:
+            Results of ensure_object(), in order of the deduplicated items
+        """
+        unique = unique_by(items, lambda item: tuple(item[0].items()))
+        if not unique:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(ENSURE_MAX_WORKERS, len(unique))) as executor:
+            return list(executor.map(
+                lambda item: self.ensure_object(app, endpoint, *item, existing=existing), unique
+            ))
+
+    def bulk_ensure(self, app: str, endpoint: str, entries: list, existing: dict | None,
+                    key_fields: tuple) -> None:
+        """
+        Ensure many objects of one endpoint exist, with bulk requests.
+
+        Batch counterpart of ensure_object(): the caller prefetches the
+        existing objects, so instead of one GET (+ POST/PATCH) per object only
+        one bulk PATCH and one bulk POST are sent for the whole list.
+
+        Args:
+            app: NetBox app (e.g., 'dcim', 'extras')
+            endpoint: API endpoint
+            entries: List of (key, create_data) tuples; for duplicate keys
+                only the first entry is synced
+            existing: Prefetched objects, mapped by the same keys as entries;
+                None if the prefetch failed
+            key_fields: Lookup fields forming the keys, e.g. ('prefix', 'vrf_id');
+                used to look objects up one by one if the prefetch failed
+        """
+        if existing is None:
+            # Same fallback as ensure_objects(): one lookup GET per object
+            log_warning(f"Looking up {endpoint} individually, prefetch unavailable")
+            for key, create_data in unique_by(entries, lambda entry: entry[0]):
+                values = key if len(key_fields) > 1 else (key,)
+                lookup = {field: 'null' if value is None else value
+                          for field, value in zip(key_fields, values)}
+                self.ensure_object(app, endpoint, lookup, create_data)
+            return
+
+        api_obj = self._endpoint(app, endpoint)
+        updates = []
+        creates = []
+
+        for key, create_data in unique_by(entries, lambda entry: entry[0]):
+            final_payload = self._prepare_payload(create_data)
+
+            # Remove slug from racks payload
+            if endpoint == 'racks':
+                final_payload.pop('slug', None)
+
+            exists = existing.get(key)
+            if exists:
+                self._diff_and_update(exists, final_payload, endpoint, defer=updates,
+                                      strip_map=self._strip_map_for(app, endpoint, exists), app=app)
+                continue
+
+            display_name = create_data.get('name') or key
+            if self.dry_run:
+                log_dry_run("CREATE", f"{endpoint} (tagged): {display_name}")
+                self._update_cache(app, endpoint, create_data.get('slug', create_data.get('name')), 0)
+            else:
+                log_success(f"Creating {endpoint} (tagged): {display_name}")
+                creates.append(final_payload)
+
+        if updates:
+            self._bulk_update_children(api_obj, endpoint, updates)
+        if creates:
+            created = self._bulk_create_children(api_obj, endpoint, creates, 'name')
+            # Keys are read from the Records' attribute dicts: getattr() on a
+            # missing field (VLANs/prefixes have no slug) would trigger
+            # pynetbox's lazy full_details() GET per object
+            self.cache.setdefault((app, endpoint), {}).update(self._index_items(created))
+
     def _update_cache(self, app, endpoint, identifier, obj_id):
-        key = f"{app}.{endpoint}"
-        if key not in self.cache: self.cache[key] = {}
-        if identifier: self.cache[key][str(identifier)] = obj_id
+        # setdefault is atomic: safe when ensure_objects() workers create concurrently
+        cache = self.cache.setdefault((app, endpoint), {})
+        if identifier:
+            cache[identifier if type(identifier) is str else str(identifier)] = obj_id
+
+    def _bulk_update_children(self, api_obj, endpoint: str, updates: list):
+        """Send queued child updates as a single bulk PATCH."""
+        try:
+            api_obj.update(updates)
+        except Exception as e:
+            log_error(f"Failed Child Update ({len(updates)} {endpoint})", e)
+
+    def _bulk_create_children(self, api_obj, endpoint: str, creates: list, key_field: str) -> list:
+        """Send queued child creates as a single bulk POST, returning the created objects."""
+        try:
+            return api_obj.create(creates)
+        except Exception as e:
+            # Bulk create is atomic in NetBox - retry one by one so a single
+            # invalid child doesn't block the rest
+            log_warning(f"Bulk create of {len(creates)} {endpoint} failed ({e}), retrying individually")
+            created = []
+            for child in creates:
+                try:
+                    created.append(api_obj.create(**child))
+                except Exception as e:
+                    log_error(f"Failed Child Create {child.get(key_field)}", e)
+            return created
+
+    def _is_managed(self, obj) -> bool:
+        """Check if a NetBox object carries the gitops tag (by ID or slug)."""
+        return has_managed_tag(getattr(obj, 'tags', None), self.managed_tag_id)
+
+    @staticmethod
+    def _safe_delete(endpoint: str, key, obj) -> bool:
+        """Delete a NetBox object, logging (with endpoint and key) instead of raising on failure."""
+        try:
+            obj.delete()
+            return True
+        except Exception as e:
+            log_error(f"Failed to delete {endpoint}: {key}", e)
+            return False
 
     # -------------------------------------------------------------------------
     # IMPORTANT: Corrected sync_children method for Device Types!
@@ -312,10 +861,17 @@ class BaseSyncer:
             child_data_list: List of child object data
             key_field: Field to use as unique key (default: 'name')
         """
-        api_obj = getattr(getattr(self.nb, app), endpoint)
-        existing_items = list(api_obj.filter(**parent_filter))
-        existing_map = {getattr(i, key_field): i for i in existing_items}
+        api_obj = self._endpoint(app, endpoint)
+        is_template = endpoint in TEMPLATE_ENDPOINTS
+        # Built straight from the paginating generator, no intermediate list
+        existing_map = {getattr(i, key_field): i for i in api_obj.filter(**parent_filter)}
         seen_keys = set()
+        sample_obj = next(iter(existing_map.values()), None)
+        strip_map = self._strip_map_for(app, endpoint, sample_obj) if sample_obj is not None else None
+
+        # Collected during the loop, sent as one bulk request each afterwards
+        updates = []
+        creates = []
 
         for data in child_data_list:
             unique_key = data.get(key_field)
@@ -323,49 +879,57 @@ class BaseSyncer:
                 continue
             seen_keys.add(unique_key)
 
-            payload = data.copy()
-            payload.update(parent_filter)
+            # Single-pass merge, parent_filter wins over child data
+            payload = {**data, **parent_filter}
 
             # FIX 1: Field transformation for create payload
             # NetBox API expects different field names for create vs filter
-            for old_field, new_field in FIELD_TRANSFORMS.items():
-                if old_field in payload:
-                    payload[new_field] = payload.pop(old_field)
+            # Key-view intersection only touches the fields actually present
+            for old_field in payload.keys() & FIELD_TRANSFORMS.keys():
+                payload[FIELD_TRANSFORMS[old_field]] = payload.pop(old_field)
 
             full_payload = self._prepare_payload(payload)
 
             # FIX 2: Remove tags for templates
             # Templates don't support tags, would cause 400 error
-            if endpoint in TEMPLATE_ENDPOINTS:
-                if 'tags' in full_payload:
-                    full_payload.pop('tags')
+            if is_template:
+                full_payload.pop('tags', None)
 
             if unique_key in existing_map:
                 existing_obj = existing_map[unique_key]
-                self._diff_and_update(existing_obj, full_payload, f"{endpoint} child")
+                self._diff_and_update(existing_obj, full_payload, f"{endpoint} child", defer=updates,
+                                      strip_map=strip_map, app=app)
             else:
                 if self.dry_run:
                     log_dry_run("CREATE Child", f"{endpoint}: {unique_key}")
                 else:
-                    try:
-                        log_success(f"Creating Child {endpoint}: {unique_key}")
-                        api_obj.create(**full_payload)
-                    except Exception as e:
-                        log_error(f"Failed Child Create {unique_key}", e)
+                    log_success(f"Creating Child {endpoint}: {unique_key}")
+                    creates.append(full_payload)
+
+        # Bulk PATCH / POST: one round-trip per endpoint instead of one per child.
+        # Both batches touch disjoint objects, so they are sent concurrently.
+        futures = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if updates:
+                futures.append(executor.submit(self._bulk_update_children, api_obj, endpoint, updates))
+            if creates:
+                futures.append(executor.submit(self._bulk_create_children, api_obj, endpoint, creates, key_field))
+        # Re-raise worker errors like the sequential calls did
+        for future in futures:
+            future.result()
 
         # FIX 3: Safe cleanup logic (prevent crash if tags field missing)
+        to_delete = []
         for key, obj in existing_map.items():
             if key not in seen_keys:
                 is_managed = False
 
                 # Check 1: Does it have tags? (Templates don't!)
                 if hasattr(obj, 'tags') and obj.tags:
-                    obj_tags = [t.slug for t in obj.tags]
-                    if MANAGED_TAG_SLUG in obj_tags:
-                        is_managed = True
+                    is_managed = self._is_managed(obj)
 
                 # Check 2: Is it a template? (Implicitly managed if in definition)
-                elif endpoint in TEMPLATE_ENDPOINTS:
+                elif is_template:
                     is_managed = True
 
                 if is_managed:
@@ -373,9 +937,11 @@ class BaseSyncer:
                         log_dry_run("DELETE Child", f"{endpoint}: {key}")
                     else:
                         log_warning(f"Deleting Child {endpoint}: {key}")
-                        try:
-                            obj.delete()
-                        except Exception as e:
-                            log_error(f"Failed Delete", e)
+                        to_delete.append((key, obj))
                 else:
-                    log_debug(f"Ignoring unmanaged item in {endpoint}: {key}")
\ No newline at end of file
+                    log_debug(f"Ignoring unmanaged item in {endpoint}: {key}")
+
+        # Stale children are independent: issue the DELETEs concurrently
+        if to_delete:
+            with ThreadPoolExecutor(max_workers=DELETE_MAX_WORKERS) as executor:
+                list(executor.map(lambda item: self._safe_delete(endpoint, *item), to_delete))
\ No newline at end of file
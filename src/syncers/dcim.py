@@ -1,48 +1,68 @@
 from src.syncers.base import BaseSyncer
+from src.utils import dump_payload
 from rich.console import Console
 
 console = Console()
 
+# Payload exclusions, built once instead of per model_dump() call
+_RACK_EXCLUDE = frozenset({'site_slug'})
+
 class DCIMSyncer(BaseSyncer):
     
     def sync_sites(self, sites):
         console.rule("[bold]Syncing Sites[/bold]")
-        for site in sites:
-            # This was good, let's keep it!
-            self.ensure_object(
-                app='dcim', 
-                endpoint='sites', 
-                lookup_data={'slug': site.slug}, 
-                create_data=site.model_dump(exclude_none=True)
-            )
+        if not sites:
+            return
+
+        # One filtered GET for all sites, then one bulk POST/PATCH
+        existing = self.prefetch_endpoint('dcim', 'sites', ('slug',), slug=[s.slug for s in sites])
+        self.bulk_ensure(
+            app='dcim',
+            endpoint='sites',
+            entries=[(site.slug, dump_payload(site)) for site in sites],
+            existing=existing,
+            key_fields=('slug',),
+        )
 
     def sync_racks(self, racks):
         console.rule("[bold]Syncing Racks[/bold]")
-        for rack in racks:
-            # FIX: Don't query the cache, query NetBox LIVE!
-            # If the site was just created, the cache doesn't know it yet.
-            # We use self.nb (pynetbox object), which should be available in BaseSyncer.
-            
-            site_obj = self.nb.dcim.sites.get(slug=rack.site_slug)
-            
-            # Fallback: If slug fails, try name (for robustness)
-            if not site_obj:
-                 site_obj = self.nb.dcim.sites.get(name=rack.site_slug)
+        if not racks:
+            return
+
+        # FIX: Don't query the cache, query NetBox LIVE!
+        # If the site was just created, the cache doesn't know it yet.
+        # All referenced sites are fetched in one request instead of one per rack.
+        site_refs = list(dict.fromkeys(rack.site_slug for rack in racks))
+        sites_api = self._endpoint('dcim', 'sites')
+        site_by_ref = {s.slug: s for s in sites_api.filter(slug=site_refs)}
 
+        # Fallback: If slug fails, try name (for robustness)
+        unresolved = [ref for ref in site_refs if ref not in site_by_ref]
+        if unresolved:
+            for s in sites_api.filter(name=unresolved):
+                site_by_ref.setdefault(s.name, s)
+
+        entries = []
+        for rack in racks:
+            site_obj = site_by_ref.get(rack.site_slug)
             if not site_obj:
                 console.print(f"[red]Error: Site '{rack.site_slug}' not found for Rack '{rack.name}' (Live Lookup failed)[/red]")
                 continue
 
-            # 2. Prepare data
             # We explicitly set the ID that we just got fresh from the API
-            payload = rack.model_dump(exclude={'site_slug'}, exclude_none=True)
+            payload = dump_payload(rack, _RACK_EXCLUDE)
             payload['site'] = site_obj.id
 
-            # 3. Sync
-            self.ensure_object(
-                app='dcim', 
-                endpoint='racks', 
-                # IMPORTANT: Lookup must contain site_id, otherwise it might find the rack globally
-                lookup_data={'site_id': site_obj.id, 'name': rack.name}, 
-                create_data=payload
-            )
\ No newline at end of file
+            # IMPORTANT: Key must contain the site, rack names are only unique per site
+            entries.append(((site_obj.id, rack.name), payload))
+
+        if not entries:
+            return
+
+        existing = self.prefetch_endpoint(
+            'dcim', 'racks', ('site_id', 'name'),
+            site_id=list({site_id for (site_id, _), _ in entries}),
+            name=[name for (_, name), _ in entries],
+        )
+        self.bulk_ensure(app='dcim', endpoint='racks', entries=entries, existing=existing,
+                         key_fields=('site_id', 'name'))
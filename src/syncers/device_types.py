@@ -1,27 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from .base import BaseSyncer
+from src.utils import dump_payload, LogBuffer
 from rich.console import Console
+from rich.progress import Progress
 
 console = Console()
 
+# Payload exclusions, built once instead of per model_dump() call
+# IMPORTANT: 'device_bays' must be excluded here
+_DT_EXCLUDE = frozenset({'interfaces', 'front_ports', 'rear_ports', 'module_bays', 'device_bays'})
+_FP_EXCLUDE = frozenset({'rear_port'})
+
 class DeviceTypeSyncer(BaseSyncer):
+    CACHE_ENDPOINTS = (('dcim', 'manufacturers'),)
     
     def sync_types(self, device_types):
         console.rule("[bold]Syncing Device Types[/bold]")
-        
+
+        # Per-type notes, printed once the progress bar is gone
+        log = LogBuffer()
+        with Progress(console=console, transient=True) as progress:
+            synced_types = self._sync_types_and_rear_ports(device_types, progress, log)
+            self._sync_remaining_templates(synced_types, progress, log)
+        log.flush()
+
+    def _sync_types_and_rear_ports(self, device_types, progress, log):
+        """
+        Pass 1: ensure device types and their rear port templates.
+
+        Args:
+            device_types: Device type models to sync
+            progress: Active Progress to report on
+            log: LogBuffer collecting per-type messages
+
+        Returns:
+            List of (model, NetBox device type) tuples that were synced
+        """
+        task = progress.add_task("Device types", total=len(device_types))
+        synced_types = []
         for dt in device_types:
+            progress.advance(task)
             # 1. Device Type Payload
-            # IMPORTANT: 'device_bays' must be excluded here
-            payload = dt.model_dump(
-                exclude={
-                    'interfaces', 'front_ports', 'rear_ports', 
-                    'module_bays', 'device_bays'
-                },
-                exclude_none=True  
-            )
+            payload = dump_payload(dt, _DT_EXCLUDE)
             
             # Manufacturer
-            manufacturer_slug = dt.manufacturer.lower().replace(" ", "-")
-            manufacturer_id = self._get_cached_id('dcim', 'manufacturers', manufacturer_slug)
+            manufacturer_id = self._get_cached_id('dcim', 'manufacturers', dt.manufacturer_slug)
             
             # Dry Run Fallback for Manufacturer
             if not manufacturer_id and self.dry_run:
@@ -34,7 +58,7 @@ class DeviceTypeSyncer(BaseSyncer):
             # =====================================================
             if hasattr(dt, 'subdevice_role') and dt.subdevice_role:
                 payload['subdevice_role'] = dt.subdevice_role
-                console.print(f"[dim]Setting subdevice_role={dt.subdevice_role} for {dt.model}[/dim]")
+                log(f"[dim]Setting subdevice_role={dt.subdevice_role} for {dt.model}[/dim]")
             # =====================================================
             
             # Ensure Parent Object (Device Type)
@@ -52,7 +76,7 @@ class DeviceTypeSyncer(BaseSyncer):
             # A. REAR PORTS (First)
             # =========================================================
             if hasattr(dt, 'rear_ports') and dt.rear_ports:
-                rp_payloads = [p.model_dump(exclude_none=True) for p in dt.rear_ports]
+                rp_payloads = list(map(dump_payload, dt.rear_ports))
                 
                 self.sync_children(
                     app='dcim',
@@ -62,81 +86,97 @@ class DeviceTypeSyncer(BaseSyncer):
                     key_field='name'
                 )
 
+            synced_types.append((dt, dt_obj))
+
+        return synced_types
+
+    def _sync_remaining_templates(self, synced_types, progress, log):
+        """
+        Pass 2: sync front port, interface, module bay and device bay templates.
+
+        Args:
+            synced_types: (model, NetBox device type) tuples from pass 1
+            progress: Active Progress to report on
+            log: LogBuffer collecting per-type messages
+        """
+        # Front ports reference rear ports: resolve all of them with one
+        # (chunked) prefetch for every synced type instead of one request per
+        # type. None if the prefetch failed; front ports are skipped then.
+        rear_port_map = {}
+        if not self.dry_run and any(dt.front_ports for dt, _ in synced_types):
+            rear_ports = self.prefetch_endpoint(
+                'dcim', 'rear_port_templates', ('device_type_id', 'name'),
+                device_type_id=[dt_obj.id for _, dt_obj in synced_types],
+            )
+            rear_port_map = None if rear_ports is None else {key: rp.id for key, rp in rear_ports.items()}
+
+        # Remaining templates; these endpoints are independent and synced
+        # concurrently per device type
+        task = progress.add_task("Templates", total=len(synced_types))
+        for dt, dt_obj in synced_types:
+            progress.advance(task)
+            child_jobs = []
+
             # =========================================================
             # B. FRONT PORTS (With Mapping)
             # =========================================================
-            if hasattr(dt, 'front_ports') and dt.front_ports:
-
-                # Build mapping
-                rear_port_map = {}
-                if not self.dry_run:
-                    all_rps = self.nb.dcim.rear_port_templates.filter(device_type_id=dt_obj.id)
-                    rear_port_map = {rp.name: rp.id for rp in all_rps}
-
+            if hasattr(dt, 'front_ports') and dt.front_ports and rear_port_map is None:
+                log(f"[red]Error: Rear ports unavailable, skipping front port templates for {dt.model}[/red]")
+            elif hasattr(dt, 'front_ports') and dt.front_ports:
                 fp_payloads = []
                 for port in dt.front_ports:
-                    p_data = port.model_dump(exclude={'rear_port'}, exclude_none=True)
+                    p_data = dump_payload(port, _FP_EXCLUDE)
                     
                     if port.rear_port:
                         if self.dry_run:
                             p_data['rear_port'] = 0
                         else:
-                            rp_id = rear_port_map.get(port.rear_port)
+                            rp_id = rear_port_map.get((dt_obj.id, port.rear_port))
                             if rp_id:
                                 p_data['rear_port'] = rp_id
                             else:
-                                console.print(f"[red]Warning: Rear Port '{port.rear_port}' missing[/red]")
+                                log(f"[red]Warning: Rear Port '{port.rear_port}' missing[/red]")
                     
                     fp_payloads.append(p_data)
 
-                self.sync_children(
-                    app='dcim',
-                    endpoint='front_port_templates',
-                    parent_filter={'device_type_id': dt_obj.id},
-                    child_data_list=fp_payloads,
-                    key_field='name'
-                )
+                child_jobs.append(('front_port_templates', fp_payloads))
 
             # =========================================================
             # C. INTERFACES
             # =========================================================
             if hasattr(dt, 'interfaces') and dt.interfaces:
-                if_payloads = [i.model_dump(exclude_none=True) for i in dt.interfaces]
-                
-                self.sync_children(
-                    app='dcim',
-                    endpoint='interface_templates',
-                    parent_filter={'device_type_id': dt_obj.id},
-                    child_data_list=if_payloads,
-                    key_field='name'
-                )
+                if_payloads = list(map(dump_payload, dt.interfaces))
+                child_jobs.append(('interface_templates', if_payloads))
                 
             # =========================================================
             # D. MODULE BAYS (GPU Slots)
             # =========================================================
             if hasattr(dt, 'module_bays') and dt.module_bays:
-                mb_payloads = [m.model_dump(exclude_none=True) for m in dt.module_bays]
-                
-                self.sync_children(
-                    app='dcim',
-                    endpoint='module_bay_templates',
-                    parent_filter={'device_type_id': dt_obj.id},
-                    child_data_list=mb_payloads,
-                    key_field='name'
-                )
+                mb_payloads = list(map(dump_payload, dt.module_bays))
+                child_jobs.append(('module_bay_templates', mb_payloads))
 
             # =========================================================
             # E. DEVICE BAYS (NEW: For Isilon/Blade Slots)
             # =========================================================
             if hasattr(dt, 'device_bays') and dt.device_bays:
-                db_payloads = [b.model_dump(exclude_none=True) for b in dt.device_bays]
+                db_payloads = list(map(dump_payload, dt.device_bays))
                 
-                console.print(f"[dim]Syncing {len(db_payloads)} device bay templates for {dt.model}[/dim]")
-                
-                self.sync_children(
-                    app='dcim',
-                    endpoint='device_bay_templates',
-                    parent_filter={'device_type_id': dt_obj.id},
-                    child_data_list=db_payloads,
-                    key_field='name'
-                )
\ No newline at end of file
+                log(f"[dim]Syncing {len(db_payloads)} device bay templates for {dt.model}[/dim]")
+                child_jobs.append(('device_bay_templates', db_payloads))
+
+            if child_jobs:
+                with ThreadPoolExecutor(max_workers=len(child_jobs)) as executor:
+                    futures = [
+                        executor.submit(
+                            self.sync_children,
+                            app='dcim',
+                            endpoint=endpoint,
+                            parent_filter={'device_type_id': dt_obj.id},
+                            child_data_list=payloads,
+                            key_field='name'
+                        )
+                        for endpoint, payloads in child_jobs
+                    ]
+                # Re-raise worker errors like the sequential calls did
+                for future in futures:
+                    future.result()
@@ -1,4 +1,5 @@
 from src.syncers.base import BaseSyncer
+from src.utils import dump_payload
 from rich.console import Console
 
 console = Console()
@@ -7,10 +8,15 @@ class ExtrasSyncer(BaseSyncer):
     
     def sync_tags(self, tags):
         console.rule("[bold]Syncing Tags[/bold]")
-        for tag in tags:
-            self.ensure_object(
-                app='extras',
-                endpoint='tags',
-                lookup_data={'slug': tag.slug},
-                create_data=tag.model_dump(exclude_none=True)
-            )
\ No newline at end of file
+        if not tags:
+            return
+
+        # One filtered GET for all tags, then one bulk POST/PATCH
+        existing = self.prefetch_endpoint('extras', 'tags', ('slug',), slug=[t.slug for t in tags])
+        self.bulk_ensure(
+            app='extras',
+            endpoint='tags',
+            entries=[(tag.slug, dump_payload(tag)) for tag in tags],
+            existing=existing,
+            key_fields=('slug',),
+        )
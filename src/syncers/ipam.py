@@ -1,64 +1,89 @@
 from src.syncers.base import BaseSyncer
+from src.utils import dump_payload, unique_by, filter_chunked, LogBuffer
 from rich.console import Console
 
 console = Console()
 
+# Payload exclusions, built once instead of per model_dump() call
+_VLAN_GROUP_EXCLUDE = frozenset({'site_slug'})
+_VLAN_EXCLUDE = frozenset({'site_slug', 'group_slug'})
+# IMPORTANT: Exclude vrf_name, as NetBox expects 'vrf' (ID)
+_PREFIX_EXCLUDE = frozenset({'site_slug', 'vlan_name', 'vrf_name'})
+
+# Scope type of site-scoped VLAN groups
+_SCOPE_SITE = 'dcim.site'
+
 class IPAMSyncer(BaseSyncer):
+    CACHE_ENDPOINTS = (('dcim', 'sites'), ('ipam', 'vrfs'), ('ipam', 'vlan_groups'))
     
     # --- NEU: VRF Sync ---
     def sync_vrfs(self, vrfs):
+        if not vrfs:
+            return
         console.rule("[bold]Syncing VRFs[/bold]")
+        vrfs = unique_by(vrfs, lambda vrf: vrf.name)
+
+        entries = []
         for vrf in vrfs:
-            # Build payload
-            payload = vrf.model_dump(exclude_none=True)
-
-            # Generate slug: Since 'slug' is a property in the model,
-            # it is often not included in model_dump (depending on config).
-            # We set it explicitly to be safe.
-            if 'slug' not in payload:
-                payload['slug'] = vrf.slug
-
-            self.ensure_object(
-                app='ipam',
-                endpoint='vrfs',
-                lookup_data={'name': vrf.name},  # VRF names must be unique
-                create_data=payload
-            )
+            # Build payload (slug is a computed field of the model)
+            entries.append((vrf.name, dump_payload(vrf)))  # VRF names must be unique
+
+        # One filtered GET for all VRFs, then one bulk POST/PATCH
+        existing = self.prefetch_endpoint('ipam', 'vrfs', ('name',), name=[name for name, _ in entries])
+        self.bulk_ensure(app='ipam', endpoint='vrfs', entries=entries, existing=existing,
+                         key_fields=('name',))
 
     def sync_vlan_groups(self, groups):
+        if not groups:
+            return
         console.rule("[bold]Syncing VLAN Groups[/bold]")
+        groups = unique_by(groups, lambda group: group.slug)
+
+        # Per-item resolution errors, printed once after the loop
+        log = LogBuffer()
         
+        entries = []
         for group in groups:
             # 1. Resolve Site ID
             site_id = None
             if group.site_slug:
                 site_id = self._get_cached_id('dcim', 'sites', group.site_slug)
                 if not site_id:
-                    console.print(f"[red]Error: Site '{group.site_slug}' not found for VLAN Group '{group.name}'[/red]")
+                    log(f"[red]Error: Site '{group.site_slug}' not found for VLAN Group '{group.name}'[/red]")
                     continue
 
             # 2. Build payload
-            payload = group.model_dump(exclude={'site_slug'}, exclude_none=True)
+            payload = dump_payload(group, _VLAN_GROUP_EXCLUDE)
             
             if site_id:
-                payload['scope_type'] = 'dcim.site'
+                payload['scope_type'] = _SCOPE_SITE
                 payload['scope_id'] = site_id
 
-            # 3. Ensure
-            self.ensure_object(
-                app='ipam',
-                endpoint='vlan_groups',
-                lookup_data={'slug': group.slug},
-                create_data=payload
-            )
+            entries.append((group.slug, payload))
+
+        log.flush()
+        if not entries:
+            return
+
+        # 3. Ensure all groups: one filtered GET, then one bulk POST/PATCH
+        existing = self.prefetch_endpoint('ipam', 'vlan_groups', ('slug',), slug=[slug for slug, _ in entries])
+        self.bulk_ensure(app='ipam', endpoint='vlan_groups', entries=entries, existing=existing,
+                         key_fields=('slug',))
 
     def sync_vlans(self, vlans):
+        if not vlans:
+            return
         console.rule("[bold]Syncing VLANs[/bold]")
+        vlans = unique_by(vlans, lambda vlan: (vlan.vid, vlan.site_slug))
+
+        # Per-item resolution errors, printed once after the loop
+        log = LogBuffer()
+        entries = []
         for vlan in vlans:
             # 1. Resolve Site ID
             site_id = self._get_cached_id('dcim', 'sites', vlan.site_slug)
             if not site_id:
-                console.print(f"[red]Error: Site {vlan.site_slug} not found for VLAN {vlan.name}[/red]")
+                log(f"[red]Error: Site {vlan.site_slug} not found for VLAN {vlan.name}[/red]")
                 continue
 
             # 2. Resolve VLAN Group ID
@@ -66,10 +91,10 @@ class IPAMSyncer(BaseSyncer):
             if vlan.group_slug:
                 group_id = self._get_cached_id('ipam', 'vlan_groups', vlan.group_slug)
                 if not group_id:
-                    console.print(f"[yellow]Warning: VLAN Group '{vlan.group_slug}' not found for VLAN {vlan.name}[/yellow]")
+                    log(f"[yellow]Warning: VLAN Group '{vlan.group_slug}' not found for VLAN {vlan.name}[/yellow]")
 
             # 3. Build payload
-            payload = vlan.model_dump(exclude={'site_slug', 'group_slug'}, exclude_none=True)
+            payload = dump_payload(vlan, _VLAN_EXCLUDE)
             
             if site_id:
                 payload['site'] = site_id
@@ -77,17 +102,63 @@ class IPAMSyncer(BaseSyncer):
             if group_id:
                 payload['group'] = group_id
             
-            # 4. Ensure
-            self.ensure_object(
-                app='ipam',
-                endpoint='vlans',
-                lookup_data={'vid': vlan.vid, 'site_id': site_id},
-                create_data=payload
+            # A VLAN is unique by (VID, Site)
+            entries.append(((vlan.vid, site_id), payload))
+
+        log.flush()
+        if not entries:
+            return
+
+        # 4. Ensure all VLANs: one filtered GET, then one bulk POST/PATCH
+        existing = self.prefetch_endpoint(
+            'ipam', 'vlans', ('vid', 'site_id'),
+            site_id=list({site_id for (_, site_id), _ in entries}),
+            vid=list({vid for (vid, _), _ in entries}),
+        )
+        self.bulk_ensure(app='ipam', endpoint='vlans', entries=entries, existing=existing,
+                         key_fields=('vid', 'site_id'))
+
+    def _vlan_ids_by_site_name(self, refs: set) -> dict:
+        """
+        Resolve VLAN IDs by (site_id, name) with one filtered (chunked) fetch.
+
+        Args:
+            refs: Set of (site_id, vlan_name) tuples; entries without a site are skipped
+
+        Returns:
+            Dictionary mapping (site_id, vlan_name) to VLAN ID
+        """
+        refs = {(site_id, name) for site_id, name in refs if site_id}
+        if not refs:
+            return {}
+
+        try:
+            vlans = filter_chunked(
+                self._endpoint('ipam', 'vlans'),
+                site_id=list({site_id for site_id, _ in refs}),
+                name=list({name for _, name in refs}),
             )
+            return {(v.site.id, v.name): v.id for v in vlans if v.site}
+        except Exception as e:
+            console.print(f"[red]Error checking VLANs: {e}[/red]")
+            return {}
 
     def sync_prefixes(self, prefixes):
+        if not prefixes:
+            return
         console.rule("[bold]Syncing Prefixes[/bold]")
+        prefixes = unique_by(prefixes, lambda pfx: (pfx.prefix, pfx.vrf_name))
+
+        # Per-item resolution errors, printed once after the loop
+        log = LogBuffer()
+
+        # All referenced VLANs in one request instead of one GET per prefix
+        vlan_ids = self._vlan_ids_by_site_name({
+            (self._get_cached_id('dcim', 'sites', pfx.site_slug), pfx.vlan_name)
+            for pfx in prefixes if pfx.vlan_name
+        })
 
+        entries = []
         for pfx in prefixes:
             # 1. Resolve Site
             site_id = self._get_cached_id('dcim', 'sites', pfx.site_slug)
@@ -97,7 +168,7 @@ class IPAMSyncer(BaseSyncer):
             if pfx.vrf_name:
                 vrf_id = self._get_cached_id('ipam', 'vrfs', pfx.vrf_name)
                 if not vrf_id:
-                     console.print(f"[red]Error: VRF '{pfx.vrf_name}' not found for Prefix {pfx.prefix}[/red]")
+                     log(f"[red]Error: VRF '{pfx.vrf_name}' not found for Prefix {pfx.prefix}[/red]")
                      # Continue - prefix will be created in Global Table
 
             # 3. Resolve VLAN
@@ -107,31 +178,28 @@ class IPAMSyncer(BaseSyncer):
                     # Without a site, the VLAN name is not unique, we only log if no global search is possible either
                     pass 
                 else:
-                    try:
-                        found_vlan = self.nb.ipam.vlans.get(name=pfx.vlan_name, site_id=site_id)
-                        if found_vlan: vlan_id = found_vlan.id
-                        else:
-                            console.print(f"[yellow]Warning: VLAN '{pfx.vlan_name}' not found in Site '{pfx.site_slug}'. Prefix created without VLAN.[/yellow]")
-                    except Exception as e:
-                        console.print(f"[red]Error checking VLAN: {e}[/red]")
+                    vlan_id = vlan_ids.get((site_id, pfx.vlan_name))
+                    if not vlan_id:
+                        log(f"[yellow]Warning: VLAN '{pfx.vlan_name}' not found in Site '{pfx.site_slug}'. Prefix created without VLAN.[/yellow]")
 
             # 4. Build payload
-            # IMPORTANT: Exclude vrf_name, as NetBox expects 'vrf' (ID)
-            payload = pfx.model_dump(exclude={'site_slug', 'vlan_name', 'vrf_name'}, exclude_none=True)
+            payload = dump_payload(pfx, _PREFIX_EXCLUDE)
             
             if site_id: payload['site'] = site_id
             if vlan_id: payload['vlan'] = vlan_id
             if vrf_id:  payload['vrf'] = vrf_id
 
-            # 5. Ensure
             # IMPORTANT: A prefix is only unique by (Prefix + VRF).
-            # We must specify 'vrf_id' in the lookup. 'null' means Global Table.
-            lookup = {'prefix': pfx.prefix}
-            lookup['vrf_id'] = vrf_id if vrf_id else 'null'
-
-            self.ensure_object(
-                app='ipam',
-                endpoint='prefixes',
-                lookup_data=lookup,
-                create_data=payload
-            )
\ No newline at end of file
+            # None means Global Table.
+            entries.append(((pfx.prefix, vrf_id or None), payload))
+
+        log.flush()
+        if not entries:
+            return
+
+        # 5. Ensure all prefixes: one filtered GET (all VRFs), then one bulk POST/PATCH
+        existing = self.prefetch_endpoint(
+            'ipam', 'prefixes', ('prefix', 'vrf_id'), prefix=list({key[0] for key, _ in entries})
+        )
+        self.bulk_ensure(app='ipam', endpoint='prefixes', entries=entries, existing=existing,
+                         key_fields=('prefix', 'vrf_id'))
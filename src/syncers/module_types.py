@@ -1,27 +1,33 @@
 from .base import BaseSyncer
+from src.utils import dump_payload, unique_by
 from rich.console import Console
 
 console = Console()
 
 class ModuleTypeSyncer(BaseSyncer):
+    CACHE_ENDPOINTS = (('dcim', 'manufacturers'),)
+
     def sync_module_types(self, module_types):
         console.rule("[bold]Syncing Module Types[/bold]")
         
-        for mt in module_types:
+        items = []
+        # Same slug defined twice: only the first definition is synced
+        for mt in unique_by(module_types, lambda mt: mt.slug):
             # 1. Prepare payload
-            payload = mt.model_dump(exclude_none=True)
+            payload = dump_payload(mt)
 
             # 2. Get manufacturer ID
-            manufacturer_slug = mt.manufacturer.lower().replace(" ", "-")
-            manufacturer_id = self._get_cached_id('dcim', 'manufacturers', manufacturer_slug)
+            manufacturer_id = self._get_cached_id('dcim', 'manufacturers', mt.manufacturer_slug)
 
             if not manufacturer_id and self.dry_run: manufacturer_id = 0
             payload['manufacturer'] = manufacturer_id
 
-            # 3. Ensure in NetBox
-            self.ensure_object(
-                app='dcim',
-                endpoint='module_types',
-                lookup_data={'slug': mt.slug},
-                create_data=payload
-            )
\ No newline at end of file
+            items.append(({'slug': mt.slug}, payload))
+
+        if not items:
+            return
+
+        # 3. Ensure in NetBox: one request for all existing module types,
+        #    then ensure concurrently (manufacturer IDs resolved above)
+        existing = self.prefetch_endpoint('dcim', 'module_types', ('slug',), slug=[lookup['slug'] for lookup, _ in items])
+        self.ensure_objects(app='dcim', endpoint='module_types', items=items, existing=existing)
\ No newline at end of file
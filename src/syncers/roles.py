@@ -1,4 +1,5 @@
 from src.syncers.base import BaseSyncer  
+from src.utils import dump_payload, unique_by
 from rich.console import Console
 
 console = Console()
@@ -6,11 +7,17 @@ console = Console()
 class RoleSyncer(BaseSyncer):
     def sync_roles(self, roles):
         console.rule("[bold]Syncing Device Roles[/bold]")
-        for role in roles:
-            self.ensure_object(
-                app='dcim',
-                endpoint='device_roles',
-                lookup_data={'slug': role.slug},
-                # FIX: exclude_none=True for consistency
-                create_data=role.model_dump(exclude_none=True)
-            )
\ No newline at end of file
+        if not roles:
+            return
+        # Same slug defined twice: only the first definition is synced
+        roles = unique_by(roles, lambda role: role.slug)
+
+        # One request for all existing roles, then ensure concurrently
+        existing = self.prefetch_endpoint('dcim', 'device_roles', ('slug',), slug=[role.slug for role in roles])
+        self.ensure_objects(
+            app='dcim',
+            endpoint='device_roles',
+            # FIX: None values dropped (exclude_none) for consistency
+            items=[({'slug': role.slug}, dump_payload(role)) for role in roles],
+            existing=existing,
+        )
\ No newline at end of file
@@ -3,8 +3,10 @@ Utility functions for NetBox GitOps Controller.
 Contains common operations, helpers, and type conversions.
 """
 
+import itertools
 import time
-from typing import Optional, Union, Any, Set, Tuple
+from functools import lru_cache
+from typing import Optional, Union, Any, Callable, Set, Tuple, Literal, get_args, get_origin
 from rich.console import Console
 
 from src.constants import (
@@ -15,6 +17,7 @@ from src.constants import (
     TERMINATION_REAR_PORT,
     ENDPOINT_FRONT_PORTS,
     ENDPOINT_REAR_PORTS,
+    PREFETCH_FILTER_CHUNK_SIZE,
 )
 
 console = Console()
@@ -24,30 +27,71 @@ console = Console()
 # COLOR UTILITIES
 # ============================================================================
 
+def _build_color_lut() -> dict:
+    """Map every common spelling of the known cable colors to their canonical hex."""
+    lut = {}
+    for name, hex_value in CABLE_COLOR_MAP.items():
+        for variant in (name, name.upper(), name.capitalize(), hex_value, hex_value.upper()):
+            lut[variant] = hex_value
+            lut[f"#{variant}"] = hex_value
+    return lut
+
+
+# Input form -> normalized hex for the known cable colors (fixed size)
+_COLOR_LUT = _build_color_lut()
+
+
+@lru_cache(maxsize=256)
+def _normalize_other_color(color_input: str) -> str:
+    """Normalize a color input missing from _COLOR_LUT (memoized, bounded)."""
+    raw = color_input.lower().strip()
+    return CABLE_COLOR_MAP.get(raw, raw).replace('#', '')
+
+
 def normalize_color(color_input: Optional[str]) -> str:
     """
     Normalize color input to hex format.
 
+    Known inputs are resolved with a single table lookup; other values are
+    normalized via a bounded lru_cache.
+
     Args:
         color_input: Color name or hex value
 
     Returns:
-        Hex color string without # prefix
+        Lowercase hex color string without # prefix
 
     Examples:
         >>> normalize_color("purple")
         '800080'
         >>> normalize_color("#FF0000")
-        'FF0000'
+        'ff0000'
         >>> normalize_color(None)
         ''
     """
     if not color_input:
         return ''
 
-    raw = color_input.lower().strip()
-    color = CABLE_COLOR_MAP.get(raw, raw)
-    return color.replace('#', '')
+    color = _COLOR_LUT.get(color_input)
+    if color is None:
+        color = _normalize_other_color(color_input)
+    return color
+
+
+# ============================================================================
+# SLUG UTILITIES
+# ============================================================================
+
+@lru_cache(maxsize=1024)
+def slugify(value: str) -> str:
+    """
+    Derive a NetBox slug from a display name (memoized).
+
+    Examples:
+        >>> slugify("Super Micro")
+        'super-micro'
+    """
+    return value.lower().replace(" ", "-")
 
 
 # ============================================================================
@@ -79,6 +123,10 @@ def extract_tag_ids_and_slugs(tags: Optional[list]) -> Tuple[Set[int], Set[str]]
     return ids, slugs
 
 
+# Never equal to a real tag ID (used when the managed tag ID is unknown)
+_MISSING_TAG_ID = object()
+
+
 def is_managed_by_gitops(obj: Optional[dict], managed_tag_id: Optional[int]) -> bool:
     """
     Check if an object is managed by GitOps based on its tags.
@@ -92,13 +140,31 @@ def is_managed_by_gitops(obj: Optional[dict], managed_tag_id: Optional[int]) ->
     """
     if not obj:
         return False
+    return has_managed_tag(obj.get('tags'), managed_tag_id)
 
-    tag_ids, tag_slugs = extract_tag_ids_and_slugs(obj.get('tags'))
 
-    if managed_tag_id and managed_tag_id in tag_ids:
-        return True
+def has_managed_tag(tags: Optional[list], managed_tag_id: Optional[int]) -> bool:
+    """
+    Check if a tag list contains the gitops tag (by ID or slug).
+
+    Stops at the first match without building intermediate lists, for
+    hot cleanup loops.
+
+    Args:
+        tags: Tags as dicts or objects (Records)
+        managed_tag_id: ID of the gitops tag
 
-    return MANAGED_TAG_SLUG in tag_slugs
+    Returns:
+        True if the gitops tag is present
+    """
+    mid = managed_tag_id or _MISSING_TAG_ID
+    for tag in tags or ():
+        if isinstance(tag, dict):
+            if tag.get('id') == mid or tag.get('slug') == MANAGED_TAG_SLUG:
+                return True
+        elif getattr(tag, 'id', None) == mid or getattr(tag, 'slug', None) == MANAGED_TAG_SLUG:
+            return True
+    return False
 
 
 # ============================================================================
@@ -142,10 +208,184 @@ def safe_getattr(obj: Any, attr: str, default: Any = None) -> Any:
     return getattr(obj, attr, default)
 
 
+def unique_by(items: list, key: Callable[[Any], Any]) -> list:
+    """
+    Drop duplicate definitions, keeping the first item per natural key.
+
+    Args:
+        items: Input objects (e.g. models loaded from YAML)
+        key: Function returning the natural key of an item
+
+    Returns:
+        List of items in original order without duplicates
+
+    Examples:
+        >>> unique_by(prefixes, lambda p: (p.prefix, p.vrf_name))
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+# ============================================================================
+# API UTILITIES
+# ============================================================================
+
+def filter_chunked(api_obj: Any, **filters: Any):
+    """
+    Run Endpoint.filter() with multi-valued filters split into bounded chunks.
+
+    List values end up in the query string, so each one is deduplicated and
+    sent in chunks of PREFETCH_FILTER_CHUNK_SIZE values (one request per
+    chunk combination) to stay below URI length limits.
+
+    Args:
+        api_obj: pynetbox Endpoint
+        **filters: API filters; list values are chunked
+
+    Yields:
+        Matching pynetbox Records
+
+    Examples:
+        >>> list(filter_chunked(nb.dcim.interfaces, device_id=device_ids))
+    """
+    size = PREFETCH_FILTER_CHUNK_SIZE
+    filter_chunks = []
+    for field, value in filters.items():
+        if isinstance(value, list):
+            value = list(dict.fromkeys(value))
+            filter_chunks.append([(field, value[i:i + size]) for i in range(0, len(value), size)])
+        else:
+            filter_chunks.append([(field, value)])
+
+    for combination in itertools.product(*filter_chunks):
+        yield from api_obj.filter(**dict(combination))
+
+
+# ============================================================================
+# MODEL UTILITIES
+# ============================================================================
+
+# Field types a flat dumper can copy as-is (immutable scalars)
+_FLAT_TYPES = (str, int, float, bool, type(None))
+
+# (model class, exclude) -> specialized dumper, or None if the model is not flat
+_FLAT_DUMPERS: dict = {}
+
+
+def _is_flat_annotation(annotation: Any) -> bool:
+    """Check if a field annotation only allows scalar values (e.g. Optional[str], Literal)."""
+    if annotation in _FLAT_TYPES:
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return all(type(arg) in _FLAT_TYPES for arg in get_args(annotation))
+    if origin is Union:
+        return all(_is_flat_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+def _build_flat_dumper(cls: Any, exclude: Optional[frozenset]):
+    """
+    Build a payload dumper specialized for one model class and exclusion set.
+
+    Only models whose remaining fields are all scalars qualify: their
+    payload is just the non-None attribute values, so the dumper reads the
+    instance __dict__ for a precomputed field tuple instead of walking the
+    generic serializer. Anything that could change the serialized form
+    (aliases, serializers, computed or extra fields) disables the fast path.
+
+    Returns:
+        Callable model -> dict, or None if the model needs the full serializer
+    """
+    decorators = cls.__pydantic_decorators__
+    if (cls.model_computed_fields or cls.model_config.get('extra') == 'allow'
+            or decorators.field_serializers or decorators.model_serializers):
+        return None
+
+    fields = []
+    for name, info in cls.model_fields.items():
+        if exclude and name in exclude:
+            continue
+        if info.alias or info.serialization_alias or not _is_flat_annotation(info.annotation):
+            return None
+        fields.append(name)
+    fields = tuple(fields)
+
+    def dump(model: Any) -> dict:
+        values = model.__dict__
+        return {name: value for name in fields if (value := values[name]) is not None}
+
+    return dump
+
+
+def dump_payload(model: Any, exclude: Optional[frozenset] = None) -> dict:
+    """
+    Serialize a Pydantic model to an API payload (None values dropped).
+
+    Equivalent to model.model_dump(exclude=exclude, exclude_none=True).
+    Flat models (scalar fields only, e.g. the template models) go through a
+    per-class specialized dumper; all others call the compiled serializer
+    directly, skipping BaseModel.model_dump()'s Python-level argument
+    handling. Pass exclusion frozensets defined once at module level.
+
+    Args:
+        model: Pydantic model instance
+        exclude: Field names to leave out
+
+    Returns:
+        Payload dictionary
+    """
+    key = (type(model), exclude)
+    try:
+        dumper = _FLAT_DUMPERS[key]
+    except KeyError:
+        dumper = _FLAT_DUMPERS[key] = _build_flat_dumper(*key)
+    except TypeError:
+        # Unhashable (mutable) exclusion set: no specialization
+        dumper = None
+
+    if dumper is not None:
+        return dumper(model)
+    return model.__pydantic_serializer__.to_python(model, exclude=exclude, exclude_none=True)
+
+
 # ============================================================================
 # TERMINATION TYPE UTILITIES
 # ============================================================================
 
+# Port classifier -> termination type. Keys are the '_endpoint' marker of
+# port dicts (front_ports) and the API URL path segment of objects (front-ports).
+_TERM_MAP = {
+    ENDPOINT_FRONT_PORTS: TERMINATION_FRONT_PORT,
+    ENDPOINT_REAR_PORTS: TERMINATION_REAR_PORT,
+    'interfaces': TERMINATION_INTERFACE,
+    'front-ports': TERMINATION_FRONT_PORT,
+    'rear-ports': TERMINATION_REAR_PORT,
+}
+
+
+@lru_cache(maxsize=4096)
+def termination_type_from_url(url: str) -> str:
+    """
+    Determine the termination type from an object's API URL (memoized).
+
+    Args:
+        url: Object URL, e.g. https://netbox/api/dcim/front-ports/123/
+
+    Returns:
+        Termination type string (defaults to dcim.interface)
+    """
+    # Endpoint is the segment before the object ID
+    parts = url.rstrip('/').rsplit('/', 2)
+    return _TERM_MAP.get(parts[-2] if len(parts) == 3 else '', TERMINATION_INTERFACE)
+
+
 def get_termination_type(obj: Union[dict, object, None]) -> str:
     """
     Determine the NetBox termination type from an object.
@@ -159,29 +399,38 @@ def get_termination_type(obj: Union[dict, object, None]) -> str:
     if obj is None:
         return TERMINATION_INTERFACE
 
-    # Check dict representation
+    # Dict representation: classified by its endpoint marker
     if isinstance(obj, dict):
-        endpoint = obj.get('_endpoint')
-        if endpoint == ENDPOINT_FRONT_PORTS:
-            return TERMINATION_FRONT_PORT
-        if endpoint == ENDPOINT_REAR_PORTS:
-            return TERMINATION_REAR_PORT
-        return TERMINATION_INTERFACE
+        return _TERM_MAP.get(obj.get('_endpoint'), TERMINATION_INTERFACE)
 
-    # Check object URL
-    url = safe_getattr(obj, 'url', '')
-    if '/front-ports/' in url:
-        return TERMINATION_FRONT_PORT
-    if '/rear-ports/' in url:
-        return TERMINATION_REAR_PORT
-
-    return TERMINATION_INTERFACE
+    # Objects: classified by the endpoint segment of their URL
+    url = getattr(obj, 'url', None)
+    return termination_type_from_url(url) if url else TERMINATION_INTERFACE
 
 
 # ============================================================================
 # CABLE UTILITIES
 # ============================================================================
 
+def cable_termination_ids(cable: dict) -> frozenset:
+    """
+    Collect the object IDs of all terminations (both ends) of a cable.
+
+    Build once per cable and reuse the set when checking several objects.
+
+    Args:
+        cable: Cable object (as dict)
+
+    Returns:
+        Frozenset of terminated object IDs
+    """
+    return frozenset(
+        term.get('object_id') or term.get('id')
+        for side in ('a_terminations', 'b_terminations')
+        for term in cable.get(side) or ()
+    )
+
+
 def cable_connects_to(cable: dict, object_id: int) -> bool:
     """
     Check if a cable connects to a specific object.
@@ -193,14 +442,7 @@ def cable_connects_to(cable: dict, object_id: int) -> bool:
     Returns:
         True if cable connects to the object
     """
-    terminations = cable.get('a_terminations', []) + cable.get('b_terminations', [])
-
-    for term in terminations or []:
-        term_id = term.get('object_id') or term.get('id')
-        if term_id == object_id:
-            return True
-
-    return False
+    return object_id in cable_termination_ids(cable)
 
 
 # ============================================================================
@@ -233,31 +475,14 @@ def extract_device_role_slug(device: Any) -> Optional[str]:
     Returns:
         Role slug string or None if not found
     """
-    # Try direct attribute access first
-    try:
-        device_role = safe_getattr(device, 'device_role', None)
-        if device_role:
-            role_slug = safe_getattr(device_role, 'slug', None)
-            if role_slug:
-                return role_slug
-    except (AttributeError, TypeError):
-        pass
-
-    # Try alternate 'role' attribute (some NetBox versions)
-    try:
-        role = safe_getattr(device, 'role', None)
+    # 'device_role' first, then 'role' (some NetBox versions); type checked once
+    is_dict = isinstance(device, dict)
+    for attr in ('device_role', 'role'):
+        role = device.get(attr) if is_dict else getattr(device, attr, None)
         if role:
-            role_slug = safe_getattr(role, 'slug', None)
+            role_slug = role.get('slug') if isinstance(role, dict) else getattr(role, 'slug', None)
             if role_slug:
                 return role_slug
-    except (AttributeError, TypeError):
-        pass
-
-    # Try dict representation
-    if isinstance(device, dict):
-        device_role = device.get('device_role')
-        if isinstance(device_role, dict):
-            return device_role.get('slug')
 
     return None
 
@@ -297,3 +522,31 @@ def log_debug(message: str):
 def log_dry_run(action: str, details: str):
     """Log dry-run action."""
     console.print(f"[yellow][DRY] {action}: {details}[/yellow]")
+
+
+class LogBuffer:
+    """
+    Collect Rich-markup log lines and print them with a single console call.
+
+    Each console.print() runs Rich's markup parsing and rendering; loops that
+    log several lines per item buffer them and flush once per phase.
+
+    Usage:
+        log = LogBuffer()
+        log(f"[dim]Checked {name}[/dim]")
+        log.flush()
+    """
+
+    __slots__ = ('_lines',)
+
+    def __init__(self):
+        self._lines = []
+
+    def __call__(self, message: str):
+        self._lines.append(message)
+
+    def flush(self):
+        """Print all buffered lines at once and clear the buffer."""
+        if self._lines:
+            console.print("\n".join(self._lines))
+            self._lines.clear()